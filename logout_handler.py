@@ -3,7 +3,7 @@
 from http.server import HTTPServer, BaseHTTPRequestHandler
 import json
 import threading
-from storage import auto_remove_poker_lan_player, release_account_session
+from storage import auto_remove_poker_lan_player, flush_pending_writes, release_account_session
 
 
 class LogoutHandler(BaseHTTPRequestHandler):
@@ -18,10 +18,11 @@ class LogoutHandler(BaseHTTPRequestHandler):
                 session_id = data.get("session_id")
                 accounts = data.get("accounts")
                 lan_players = data.get("lan_players")
+                players_to_remove = []
                 
                 if account and session_id:
                     release_account_session(account, session_id)
-                    auto_remove_poker_lan_player(account)
+                    players_to_remove.append(account)
                 if isinstance(accounts, list):
                     for entry in accounts:
                         if not isinstance(entry, dict):
@@ -30,12 +31,18 @@ class LogoutHandler(BaseHTTPRequestHandler):
                         entry_session_id = entry.get("session_id")
                         if entry_account and entry_session_id:
                             release_account_session(entry_account, entry_session_id)
-                            auto_remove_poker_lan_player(entry_account)
+                            players_to_remove.append(entry_account)
                 if isinstance(lan_players, list):
                     for player_name in lan_players:
                         if not player_name:
                             continue
-                        auto_remove_poker_lan_player(player_name)
+                        players_to_remove.append(player_name)
+                
+                # Table removals share one upload; it is flushed (and any
+                # failure reported) before the request is answered.
+                for player_name in players_to_remove:
+                    auto_remove_poker_lan_player(player_name, sync=False)
+                flush_pending_writes()
                 
                 self.send_response(200)
                 self.send_header("Content-type", "application/json")
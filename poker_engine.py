@@ -16,6 +16,7 @@ STREET_TURN = "turn"
 STREET_RIVER = "river"
 STREET_SHOWDOWN = "showdown"
 STREET_FINISHED = "finished"
+_HAND_OVER_STREETS = frozenset((STREET_SHOWDOWN, STREET_FINISHED))
 
 
 def to_cents(amount):
@@ -32,6 +33,13 @@ def _new_deck(rng):
     return deck
 
 
+def restore_deck(state):
+    """Rebuild the deck of a hand that was stored with only its seed."""
+    if "deck" not in state and "deck_seed" in state:
+        state["deck"] = _new_deck(Random(state["deck_seed"]))
+    return state
+
+
 def _rank_counts(cards):
     counts = {}
     for card in cards:
@@ -214,10 +222,21 @@ def run_showdown(state):
     }
 
 
+def _draw_cards(state, count):
+    # The shuffled deck is never mutated; deck_index counts cards already
+    # drawn from the top (the end of the list), so a draw is an int bump.
+    deck = state["deck"]
+    drawn = state.get("deck_index", 0)
+    remaining = len(deck) - drawn
+    count = min(count, remaining)
+    if count <= 0:
+        return []
+    state["deck_index"] = drawn + count
+    return deck[remaining - count : remaining][::-1]
+
+
 def _deal_board_card(state, count):
-    for _ in range(count):
-        if state["deck"]:
-            state["board"].append(state["deck"].pop())
+    state["board"].extend(_draw_cards(state, count))
 
 
 def _start_next_street(state):
@@ -227,8 +246,7 @@ def _start_next_street(state):
         return
     if all(player.get("all_in", False) for player in alive):
         while len(state["board"]) < 5:
-            if state["deck"]:
-                state["deck"].pop()
+            _draw_cards(state, 1)
             _deal_board_card(state, 1)
         state["street"] = STREET_SHOWDOWN
         run_showdown(state)
@@ -241,18 +259,15 @@ def _start_next_street(state):
     state["min_raise"] = state.get("table_min_raise", state["big_blind"])
 
     if state["street"] == STREET_PRE_FLOP:
-        if state["deck"]:
-            state["deck"].pop()
+        _draw_cards(state, 1)
         _deal_board_card(state, 3)
         state["street"] = STREET_FLOP
     elif state["street"] == STREET_FLOP:
-        if state["deck"]:
-            state["deck"].pop()
+        _draw_cards(state, 1)
         _deal_board_card(state, 1)
         state["street"] = STREET_TURN
     elif state["street"] == STREET_TURN:
-        if state["deck"]:
-            state["deck"].pop()
+        _draw_cards(state, 1)
         _deal_board_card(state, 1)
         state["street"] = STREET_RIVER
     elif state["street"] == STREET_RIVER:
@@ -267,7 +282,7 @@ def _start_next_street(state):
 
 
 def _maybe_advance(state):
-    if state["street"] in {STREET_SHOWDOWN, STREET_FINISHED}:
+    if state["street"] in _HAND_OVER_STREETS:
         return
     if _collect_uncontested(state):
         return
@@ -288,7 +303,9 @@ def _maybe_advance(state):
 
 
 def create_hand(player_stacks, small_blind, big_blind, min_raise=None, dealer_index=0, seed=None):
-    rng = Random(seed)
+    # The seed is kept on the hand so the deck can be rebuilt from it.
+    deck_seed = seed if seed is not None else Random().getrandbits(64)
+    rng = Random(deck_seed)
     players = []
     for name, stack in player_stacks:
         stack_cents = to_cents(stack)
@@ -320,6 +337,8 @@ def create_hand(player_stacks, small_blind, big_blind, min_raise=None, dealer_in
         "big_blind": max(1, to_cents(big_blind)),
         "dealer_index": dealer_index,
         "deck": deck,
+        "deck_seed": deck_seed,
+        "deck_index": 0,
         "board": [],
         "street": STREET_PRE_FLOP,
         "current_bet": 0,
@@ -338,7 +357,7 @@ def create_hand(player_stacks, small_blind, big_blind, min_raise=None, dealer_in
             player = players[idx]
             if player["stack"] <= 0:
                 continue
-            player["hole"].append(deck.pop())
+            player["hole"].extend(_draw_cards(state, 1))
 
     sb_index = _next_seated_index(players, dealer_index)
     bb_index = _next_seated_index(players, sb_index)
@@ -364,7 +383,7 @@ def create_hand(player_stacks, small_blind, big_blind, min_raise=None, dealer_in
 
 
 def legal_actions(state, player_name):
-    if not state or state.get("street") in {STREET_SHOWDOWN, STREET_FINISHED}:
+    if not state or state.get("street") in _HAND_OVER_STREETS:
         return {"actions": []}
     if state["players"][state.get("acting_index", 0)]["name"] != player_name:
         return {"actions": []}
@@ -405,7 +424,7 @@ def legal_actions(state, player_name):
 
 def apply_action(state, player_name, action, amount=None):
     normalized_action = str(action).strip().lower()
-    if state.get("street") in {STREET_SHOWDOWN, STREET_FINISHED}:
+    if state.get("street") in _HAND_OVER_STREETS:
         return False, "Hand already finished."
     actor_idx = state.get("acting_index")
     if actor_idx is None:
@@ -520,7 +539,7 @@ def apply_action(state, player_name, action, amount=None):
         }
     )
 
-    if state.get("street") not in {STREET_SHOWDOWN, STREET_FINISHED}:
+    if state.get("street") not in _HAND_OVER_STREETS:
         next_idx = _next_active_index(state["players"], actor_idx)
         if next_idx is not None:
             state["acting_index"] = next_idx
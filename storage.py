@@ -1,11 +1,18 @@
 """Persistent storage helpers for accounts and odds."""
 
+import atexit
 import json
+import logging
+import math
+import os
 import random
+import socket
+import sys
 import threading
 import time
 from contextlib import contextmanager
 from copy import deepcopy
+from http import client as http_client
 from urllib import error as urllib_error
 from urllib import parse as urllib_parse
 from urllib import request as urllib_request
@@ -16,18 +23,54 @@ from poker_engine import apply_action as poker_apply_action
 from poker_engine import create_hand as poker_create_hand
 from poker_engine import from_cents
 from poker_engine import legal_actions as poker_legal_actions
+from poker_engine import restore_deck as poker_restore_deck
+from poker_engine import to_cents
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 DEFAULT_ODDS = 1.5
 ODDS_ACCOUNT_KEY = "__house_odds__"
-GAME_STAT_KEYS = {"player_guess", "computer_guess", "blackjack", "poker"}
+GAME_STAT_KEYS = ("player_guess", "computer_guess", "blackjack", "poker")
+_GAME_STAT_KEY_SET = frozenset(GAME_STAT_KEYS)
+STATS_MONEY_FIELDS = ("total_game_buy_in", "total_game_payout", "total_game_net")
 DEFAULT_ACCOUNT_SESSION_TTL_SECONDS = 6 * 60 * 60
+ACCOUNT_SESSION_REFRESH_SECONDS = 60
 
 SUPABASE_TABLE_DEFAULT = "app_state"
 SUPABASE_STATE_ROW_ID = 1
+_logger = logging.getLogger(__name__)
 _in_process_write_lock = threading.RLock()
+_write_lock_depth = threading.local()
 _storage_backend_cache = None
+_resolved_secrets = {}
+_accounts_snapshot_cache = None
 _state_read_cache = None
 _SUPABASE_READ_CACHE_TTL_SECONDS = 0.35
+_SUPABASE_REQUEST_TIMEOUT_SECONDS = 15
+_supabase_idle_connections = []
+_SUPABASE_IDLE_CONNECTIONS_MAX = 4
+_supabase_connection_lock = threading.Lock()
+_supabase_read_lock = threading.Lock()
+_pending_write_data = None
+_pending_write_timer = None
+_pending_write_count = 0
+_pending_write_first_at = 0.0
+_pending_write_flush_due = False
+_WRITE_DEBOUNCE_SECONDS = 0.02
+_WRITE_BATCH_MAX_SECONDS = 0.2
+_WRITE_BATCH_MAX_MUTATIONS = 50
+_WRITE_RETRY_MAX_SECONDS = 5.0
+_pending_write_retry_seconds = 0.0
+_inflight_write_data = None
+_state_write_sequence = 0
+_uploaded_write_sequence = 0
+_supabase_upload_lock = threading.Lock()
+_last_uploaded_body = None
+_last_uploaded_state = None
+_last_read_state = None
 
 
 def _default_data():
@@ -40,44 +83,91 @@ def _default_data():
     }
 
 
+# Flat templates of immutable values: dict.copy() is a complete clone.
+_STATS_BUCKET_TEMPLATE = {
+    "rounds_played": 0,
+    "rounds_won": 0,
+    "total_game_buy_in_cents": 0,
+    "total_game_payout_cents": 0,
+    "total_game_net_cents": 0,
+    "current_win_percentage": 0.0,
+}
+_GAME_LIMITS_TEMPLATE = {
+    "max_range": None,
+    "max_buy_in": None,
+    "max_guesses": None,
+}
+_ACCOUNT_SETTINGS_TEMPLATE = {
+    "allow_negative_balance": False,
+    "dark_mode": True,
+    "enable_animations": True,
+    "confirm_before_bet": True,
+    "profile_avatar": "",
+}
+
+
 def _default_stats_bucket():
-    return {
-        "rounds_played": 0,
-        "rounds_won": 0,
-        "total_game_buy_in": 0.0,
-        "total_game_payout": 0.0,
-        "total_game_net": 0.0,
-        "current_win_percentage": 0.0,
-    }
+    return _STATS_BUCKET_TEMPLATE.copy()
+
+
+_STATS_INT_FIELDS = (
+    "rounds_played",
+    "rounds_won",
+    "total_game_buy_in_cents",
+    "total_game_payout_cents",
+    "total_game_net_cents",
+)
+_STATS_BUCKET_KEYS = frozenset(_STATS_INT_FIELDS + ("current_win_percentage",))
+_ACCOUNT_STATS_KEYS = _STATS_BUCKET_KEYS | {"game_breakdown"}
 
 
 def _default_account_stats():
-    stats = _default_stats_bucket()
-    stats["game_breakdown"] = {game_key: _default_stats_bucket() for game_key in GAME_STAT_KEYS}
+    stats = _STATS_BUCKET_TEMPLATE.copy()
+    stats["game_breakdown"] = {game_key: _STATS_BUCKET_TEMPLATE.copy() for game_key in GAME_STAT_KEYS}
     return stats
 
 
 def _default_game_limits():
-    return {
-        "max_range": None,
-        "max_buy_in": None,
-        "max_guesses": None,
-    }
+    return _GAME_LIMITS_TEMPLATE.copy()
 
 
 def _default_account_settings():
-    return {
-        "allow_negative_balance": False,
-        "dark_mode": True,
-        "enable_animations": True,
-        "confirm_before_bet": True,
-        "profile_avatar": "",
-    }
+    return _ACCOUNT_SETTINGS_TEMPLATE.copy()
 
 
-def _persist_if_changed_unlocked(data, before_data):
-    if data != before_data:
-        _write_data_unlocked(data)
+def _to_cents(amount):
+    # Signed money amount as integer cents, rounded in the house's favor.
+    return int(round(house_round_delta(amount) * 100))
+
+
+def _balance_to_cents(balance):
+    return int(round(house_round_balance(balance) * 100))
+
+
+def _safe_int(raw_value, default):
+    # Coerce without raising on the common, already-numeric case.
+    if isinstance(raw_value, int):
+        return int(raw_value)
+    if isinstance(raw_value, float):
+        return int(raw_value) if math.isfinite(raw_value) else default
+    if isinstance(raw_value, str):
+        try:
+            return int(raw_value)
+        except ValueError:
+            return default
+    return default
+
+
+def _safe_float(raw_value, default):
+    if isinstance(raw_value, (int, float)):
+        return float(raw_value) if raw_value == raw_value else default
+    if isinstance(raw_value, str):
+        try:
+            parsed = float(raw_value)
+        except ValueError:
+            return default
+        return parsed if parsed == parsed else default
+    return default
 
 
 def _normalize_stats_bucket(raw_stats):
@@ -85,40 +175,21 @@ def _normalize_stats_bucket(raw_stats):
     if not isinstance(raw_stats, dict):
         return stats
 
-    try:
-        rounds_played = int(raw_stats.get("rounds_played", 0))
-    except (TypeError, ValueError):
-        rounds_played = 0
-    try:
-        rounds_won = int(raw_stats.get("rounds_won", 0))
-    except (TypeError, ValueError):
-        rounds_won = 0
+    rounds_played = _safe_int(raw_stats.get("rounds_played", 0), 0)
+    rounds_won = _safe_int(raw_stats.get("rounds_won", 0), 0)
     rounds_played = max(0, rounds_played)
     rounds_won = max(0, min(rounds_won, rounds_played))
 
     stats["rounds_played"] = rounds_played
     stats["rounds_won"] = rounds_won
-    try:
-        stats["total_game_buy_in"] = house_round_balance(raw_stats.get("total_game_buy_in", 0.0))
-    except Exception:
-        stats["total_game_buy_in"] = 0.0
-    try:
-        stats["total_game_payout"] = house_round_balance(raw_stats.get("total_game_payout", 0.0))
-    except Exception:
-        stats["total_game_payout"] = 0.0
-    try:
-        stats["total_game_net"] = house_round_balance(raw_stats.get("total_game_net", 0.0))
-    except Exception:
-        stats["total_game_net"] = 0.0
+    for field in STATS_MONEY_FIELDS:
+        stats[f"{field}_cents"] = _normalize_stats_cents(raw_stats, field)
 
     if rounds_played > 0:
         computed_percentage = (rounds_won / rounds_played) * 100.0
     else:
         computed_percentage = 0.0
-    try:
-        saved_percentage = float(raw_stats.get("current_win_percentage", computed_percentage))
-    except (TypeError, ValueError):
-        saved_percentage = computed_percentage
+    saved_percentage = _safe_float(raw_stats.get("current_win_percentage", computed_percentage), computed_percentage)
     if saved_percentage < 0:
         saved_percentage = 0.0
     if saved_percentage > 100:
@@ -127,14 +198,69 @@ def _normalize_stats_bucket(raw_stats):
     return stats
 
 
+def _normalize_stats_cents(raw_stats, field):
+    raw_cents = _safe_int(raw_stats.get(f"{field}_cents"), None)
+    if raw_cents is not None:
+        return raw_cents
+    # Older saved data stored these totals as float dollars.
+    try:
+        return _balance_to_cents(raw_stats.get(field, 0.0))
+    except Exception:
+        return 0
+
+
+def _public_stats_bucket(stats):
+    # Expose stored cent totals as float dollars at the API boundary.
+    public = {key: value for key, value in stats.items() if key != "game_breakdown"}
+    for field in STATS_MONEY_FIELDS:
+        public[field] = from_cents(public.pop(f"{field}_cents", 0))
+    return public
+
+
+def _public_account_stats(stats):
+    public = _public_stats_bucket(stats)
+    public["game_breakdown"] = {
+        game_key: _public_stats_bucket(bucket) for game_key, bucket in stats.get("game_breakdown", {}).items()
+    }
+    return public
+
+
+def _is_canonical_stats_bucket(stats, expected_keys=_STATS_BUCKET_KEYS):
+    # One pass over exactly the shape _normalize_stats_bucket produces.
+    if type(stats) is not dict or stats.keys() != expected_keys:
+        return False
+    for field in _STATS_INT_FIELDS:
+        if type(stats[field]) is not int:
+            return False
+    rounds_played = stats["rounds_played"]
+    if not 0 <= stats["rounds_won"] <= rounds_played:
+        return False
+    percentage = stats["current_win_percentage"]
+    if type(percentage) is not float:
+        return False
+    if rounds_played > 0:
+        return percentage == (stats["rounds_won"] / rounds_played) * 100.0
+    return 0.0 <= percentage <= 100.0
+
+
 def _normalize_account_stats(raw_stats):
+    # Stats written by this version are already canonical; the freshly parsed
+    # dicts are reused as-is instead of being rebuilt field by field.
+    if _is_canonical_stats_bucket(raw_stats, _ACCOUNT_STATS_KEYS):
+        raw_breakdown = raw_stats["game_breakdown"]
+        if (
+            type(raw_breakdown) is dict
+            and raw_breakdown.keys() == _GAME_STAT_KEY_SET
+            and all(_is_canonical_stats_bucket(bucket) for bucket in raw_breakdown.values())
+        ):
+            return raw_stats
+
     stats = _normalize_stats_bucket(raw_stats)
-    breakdown = {game_key: _default_stats_bucket() for game_key in GAME_STAT_KEYS}
-    if isinstance(raw_stats, dict):
-        raw_breakdown = raw_stats.get("game_breakdown", {})
-        if isinstance(raw_breakdown, dict):
-            for game_key in GAME_STAT_KEYS:
-                breakdown[game_key] = _normalize_stats_bucket(raw_breakdown.get(game_key, {}))
+    raw_breakdown = raw_stats.get("game_breakdown") if isinstance(raw_stats, dict) else None
+    if isinstance(raw_breakdown, dict):
+        breakdown = {game_key: _normalize_stats_bucket(raw_breakdown.get(game_key, {})) for game_key in GAME_STAT_KEYS}
+    else:
+        breakdown = {game_key: _default_stats_bucket() for game_key in GAME_STAT_KEYS}
     stats["game_breakdown"] = breakdown
     return stats
 
@@ -163,20 +289,25 @@ def _normalize_account_settings(raw_settings):
 
 
 def _normalize_session_id(raw_value):
-    if not isinstance(raw_value, str):
+    if type(raw_value) is not str:
         return None
-    normalized = raw_value.strip()
-    if not normalized:
-        return None
-    return normalized
+    return raw_value.strip() or None
 
 
 def _normalize_session_timestamp(raw_value):
-    try:
+    # Saved timestamps are floats; only strings need parsing.
+    if type(raw_value) is float:
+        normalized = raw_value
+    elif type(raw_value) is int:
         normalized = float(raw_value)
-    except (TypeError, ValueError):
+    elif isinstance(raw_value, str):
+        try:
+            normalized = float(raw_value)
+        except ValueError:
+            return None
+    else:
         return None
-    if normalized <= 0:
+    if not normalized > 0:
         return None
     return normalized
 
@@ -186,9 +317,9 @@ def _normalize_active_sessions(raw_sessions, account_names):
     if not isinstance(raw_sessions, dict):
         return normalized
 
-    for account_name, raw_entry in raw_sessions.items():
-        if account_name not in account_names:
-            continue
+    # Sessions of deleted accounts drop out in one set intersection.
+    for account_name in raw_sessions.keys() & account_names:
+        raw_entry = raw_sessions[account_name]
         if not isinstance(raw_entry, dict):
             continue
         session_id = _normalize_session_id(raw_entry.get("session_id"))
@@ -212,16 +343,14 @@ def _coerce_session_ttl_seconds(ttl_seconds):
 
 
 def _prune_expired_sessions_unlocked(data, now_epoch, ttl_seconds):
-    account_names = set(data.get("accounts", {}).keys())
+    account_names = data.get("accounts", {}).keys()
     raw_sessions = data.get("active_sessions", {})
     normalized_sessions = _normalize_active_sessions(raw_sessions, account_names)
-    pruned_sessions = {}
-    for account_name, session_entry in normalized_sessions.items():
-        last_seen = float(session_entry["last_seen_epoch"])
-        if now_epoch - last_seen > ttl_seconds:
-            continue
-        pruned_sessions[account_name] = session_entry
-    data["active_sessions"] = pruned_sessions
+    data["active_sessions"] = {
+        account_name: session_entry
+        for account_name, session_entry in normalized_sessions.items()
+        if now_epoch - session_entry["last_seen_epoch"] <= ttl_seconds
+    }
 
 
 def _load_streamlit_secret(name):
@@ -239,11 +368,33 @@ def _load_streamlit_secret(name):
 
 
 def _resolve_secret(name):
-    import os
+    # Resolved values are memoized; misses are not, so a secret configured
+    # after a failed lookup is still picked up on the next call.
+    cached = _resolved_secrets.get(name)
+    if cached is not None:
+        return cached
     value = os.getenv(name)
     if value is not None and str(value).strip():
-        return str(value).strip()
-    return _load_streamlit_secret(name)
+        resolved = str(value).strip()
+    else:
+        resolved = _load_streamlit_secret(name)
+    if resolved:
+        _resolved_secrets[name] = resolved
+    return resolved
+
+
+def _coerce_cache_ttl_seconds(raw_value):
+    # "inf" makes the in-process cache authoritative, which is only safe when
+    # this process is the sole writer of the state row.
+    if raw_value is None:
+        return _SUPABASE_READ_CACHE_TTL_SECONDS
+    try:
+        ttl = float(raw_value)
+    except (TypeError, ValueError):
+        return _SUPABASE_READ_CACHE_TTL_SECONDS
+    if ttl != ttl or ttl < 0:
+        return _SUPABASE_READ_CACHE_TTL_SECONDS
+    return ttl
 
 
 def _get_storage_backend():
@@ -265,50 +416,126 @@ def _get_storage_backend():
             "url": supabase_url.rstrip("/"),
             "key": supabase_key,
             "table": supabase_table,
+            "cache_ttl_seconds": _coerce_cache_ttl_seconds(_resolve_secret("SUPABASE_CACHE_TTL_SECONDS")),
         }
     else:
         raise RuntimeError("Supabase is not configured. Account storage is unavailable.")
     return _storage_backend_cache
 
 
+def _state_cache_is_authoritative(backend):
+    # Only a sole writer (infinite TTL) may base writes on in-memory state. With
+    # other writers the row is replaced wholesale, so a write built on a cached
+    # copy would silently undo whatever they stored since it was read.
+    return math.isinf(backend["cache_ttl_seconds"])
+
+
 def _invalidate_state_read_cache():
     global _state_read_cache
     _state_read_cache = None
 
 
-def _is_cached_state_valid_unlocked(backend):
-    if not isinstance(_state_read_cache, dict):
+def _is_cached_state_valid_unlocked(backend, cache_entry=None):
+    if cache_entry is None:
+        cache_entry = _state_read_cache
+    if not isinstance(cache_entry, dict):
         return False
-    cached_backend_type = _state_read_cache.get("backend_type")
-    backend_type = backend.get("type")
-    if cached_backend_type != backend_type:
+    if cache_entry["backend_type"] != backend.get("type"):
         return False
-    if backend_type == "supabase":
-        loaded_epoch = float(_state_read_cache.get("loaded_epoch", 0.0))
-        return (time.time() - loaded_epoch) <= _SUPABASE_READ_CACHE_TTL_SECONDS
-    return False
+    return time.monotonic() <= cache_entry["expires_at"]
 
 
 def _set_state_read_cache_unlocked(backend, data):
     global _state_read_cache
     backend_type = backend.get("type")
+    # The TTL is process-local, so it runs on the monotonic clock and a wall
+    # clock step cannot extend or expire the cache early.
+    loaded_at = time.monotonic()
     _state_read_cache = {
         "backend_type": backend_type,
-        "loaded_epoch": time.time(),
+        "loaded_at": loaded_at,
+        # Only the Supabase backend caches; readers compare against a
+        # precomputed deadline instead of redoing the TTL arithmetic.
+        "expires_at": loaded_at + backend["cache_ttl_seconds"] if backend_type == "supabase" else 0.0,
         "local_mtime": None,
-        "data": deepcopy(data),
+        # Published states are never mutated after this point: writers work on
+        # copies from _load_data_for_write_unlocked, so no defensive copy here.
+        "data": data,
     }
 
 
-def _supabase_request(method, path, payload=None, extra_headers=None):
+# Persisted state is a plain tree (transient index keys are stripped first),
+# so the fallback encoder skips circular-reference bookkeeping.
+_STATE_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), check_circular=False)
+
+
+def _json_dumps_bytes(payload):
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    return _STATE_JSON_ENCODER.encode(payload).encode("utf-8")
+
+
+def _checkout_supabase_connection(backend):
+    # Keep-alive connections are pooled so repeat requests skip the TCP and
+    # TLS handshakes; each connection serves one request at a time.
+    with _supabase_connection_lock:
+        while _supabase_idle_connections:
+            connection_url, connection = _supabase_idle_connections.pop()
+            if connection_url == backend["url"]:
+                return connection, True
+            connection.close()
+    return _open_supabase_connection(backend), False
+
+
+def _open_supabase_connection(backend):
+    parsed = urllib_parse.urlsplit(backend["url"])
+    connection_class = http_client.HTTPSConnection if parsed.scheme == "https" else http_client.HTTPConnection
+    return connection_class(parsed.hostname, parsed.port, timeout=_SUPABASE_REQUEST_TIMEOUT_SECONDS)
+
+
+def _release_supabase_connection(backend, connection, response):
+    if not response.will_close:
+        with _supabase_connection_lock:
+            # Bursts of concurrent requests open extra connections; only a few
+            # are kept for reuse and the rest are closed.
+            if len(_supabase_idle_connections) < _SUPABASE_IDLE_CONNECTIONS_MAX:
+                _supabase_idle_connections.append((backend["url"], connection))
+                return
+    connection.close()
+
+
+def _supabase_uses_proxy(backend):
+    # The pooled connections talk to the host directly, so deployments behind
+    # an HTTP(S)_PROXY keep going through urllib, which honors it.
+    parsed = urllib_parse.urlsplit(backend["url"])
+    if parsed.scheme not in urllib_request.getproxies():
+        return False
+    return not urllib_request.proxy_bypass(parsed.hostname or "")
+
+
+def _supabase_request_via_urllib(backend, method, path, body, headers):
+    request = urllib_request.Request(f"{backend['url']}{path}", data=body, headers=headers, method=method)
+    try:
+        with urllib_request.urlopen(request, timeout=_SUPABASE_REQUEST_TIMEOUT_SECONDS) as response:
+            return response.read()
+    except urllib_error.HTTPError as exc:
+        details = exc.read().decode("utf-8", errors="replace")
+        raise RuntimeError(f"Supabase request failed ({exc.code}): {details}") from exc
+    except urllib_error.URLError as exc:
+        raise RuntimeError(f"Supabase request failed: {exc.reason}") from exc
+
+
+def _supabase_request_raw(method, path, payload=None, extra_headers=None):
     backend = _get_storage_backend()
     if backend.get("type") != "supabase":
         raise RuntimeError("Supabase request attempted without Supabase backend configuration.")
 
-    url = f"{backend['url']}{path}"
+    url_path = urllib_parse.urlsplit(backend["url"]).path.rstrip("/") + path
     body = None
-    if payload is not None:
-        body = json.dumps(payload).encode("utf-8")
+    if isinstance(payload, bytes):
+        body = payload
+    elif payload is not None:
+        body = _json_dumps_bytes(payload)
 
     headers = {
         "apikey": backend["key"],
@@ -318,29 +545,56 @@ def _supabase_request(method, path, payload=None, extra_headers=None):
     if extra_headers:
         headers.update(extra_headers)
 
-    request = urllib_request.Request(url, data=body, headers=headers, method=method)
-    try:
-        with urllib_request.urlopen(request, timeout=15) as response:
+    if _supabase_uses_proxy(backend):
+        return _supabase_request_via_urllib(backend, method, path, body, headers)
+
+    connection, reused = _checkout_supabase_connection(backend)
+    while True:
+        try:
+            connection.request(method, url_path, body=body, headers=headers)
+            response = connection.getresponse()
             raw = response.read()
-    except urllib_error.HTTPError as exc:
-        details = exc.read().decode("utf-8", errors="replace")
-        raise RuntimeError(f"Supabase request failed ({exc.code}): {details}") from exc
-    except urllib_error.URLError as exc:
-        raise RuntimeError(f"Supabase request failed: {exc.reason}") from exc
+        except (http_client.HTTPException, OSError) as exc:
+            connection.close()
+            if reused and not isinstance(exc, socket.timeout):
+                # The server may have closed an idle keep-alive connection;
+                # retry once on a fresh one. A timeout is not retried.
+                connection, reused = _open_supabase_connection(backend), False
+                continue
+            raise RuntimeError(f"Supabase request failed: {exc}") from exc
+        break
+    _release_supabase_connection(backend, connection, response)
+    if response.status >= 400:
+        details = raw.decode("utf-8", errors="replace")
+        raise RuntimeError(f"Supabase request failed ({response.status}): {details}")
+    return raw
 
+
+def _decode_supabase_body(raw):
     if not raw:
         return None
+    # Both decoders accept the raw bytes, which skips a decoded copy of the body.
     try:
-        return json.loads(raw.decode("utf-8"))
-    except json.JSONDecodeError:
+        if orjson is not None:
+            return orjson.loads(raw)
+        return json.loads(raw)
+    except ValueError:
         return None
 
 
-def _read_supabase_state_unlocked():
+def _supabase_request(method, path, payload=None, extra_headers=None):
+    return _decode_supabase_body(_supabase_request_raw(method, path, payload, extra_headers))
+
+
+def _read_supabase_state_body_unlocked():
     backend = _get_storage_backend()
     table = backend["table"]
     query = urllib_parse.urlencode({"id": f"eq.{SUPABASE_STATE_ROW_ID}", "select": "data"})
-    rows = _supabase_request("GET", f"/rest/v1/{table}?{query}")
+    return _supabase_request_raw("GET", f"/rest/v1/{table}?{query}")
+
+
+def _decode_supabase_state(raw):
+    rows = _decode_supabase_body(raw)
     if not isinstance(rows, list) or not rows:
         return None
     row = rows[0]
@@ -352,14 +606,17 @@ def _read_supabase_state_unlocked():
     return None
 
 
-def _write_supabase_state_unlocked(data):
+def _encode_supabase_state(data):
+    return _json_dumps_bytes([{"id": SUPABASE_STATE_ROW_ID, "data": data}])
+
+
+def _write_supabase_state_unlocked(body):
     backend = _get_storage_backend()
     table = backend["table"]
-    payload = [{"id": SUPABASE_STATE_ROW_ID, "data": data}]
     _supabase_request(
         "POST",
         f"/rest/v1/{table}?on_conflict=id",
-        payload=payload,
+        payload=body,
         extra_headers={"Prefer": "resolution=merge-duplicates,return=minimal"},
     )
 
@@ -368,13 +625,176 @@ def _write_supabase_state_unlocked(data):
 def _accounts_write_lock():
     _get_storage_backend()
     with _in_process_write_lock:
-        yield
+        # The lock is reentrant; only the outermost acquisition flushes full
+        # batches.
+        depth = getattr(_write_lock_depth, "value", 0)
+        _write_lock_depth.value = depth + 1
+        try:
+            yield
+        finally:
+            _write_lock_depth.value = depth
+    if depth == 0 and _pending_write_flush_due:
+        # A write batch filled up inside the critical section; it uploads here,
+        # once this thread no longer holds the lock. The caller's mutation is
+        # already published and stays pending on failure, so the error is
+        # logged and left to the retry timer instead of replacing its result.
+        try:
+            flush_pending_writes()
+        except RuntimeError as exc:
+            _logger.warning("Deferred state upload failed; retrying in the background: %s", exc)
+
+
+def _persistable_data(data):
+    persisted = dict(data)
+    if "poker_lan" in persisted:
+        persisted["poker_lan"] = _persistable_poker_lan_state(persisted["poker_lan"])
+    return persisted
+
+
+def _next_write_sequence_unlocked():
+    global _state_write_sequence
+    _state_write_sequence += 1
+    return _state_write_sequence
+
+
+def _upload_state(data, sequence):
+    # Encoding and the upload itself only need ordering against other
+    # uploads, not the in-memory state lock.
+    global _uploaded_write_sequence, _last_uploaded_body, _last_uploaded_state
+    persisted = _persistable_data(data)
+    body = _encode_supabase_state(persisted)
+    with _supabase_upload_lock:
+        if sequence <= _uploaded_write_sequence:
+            return
+        # The row is replaced wholesale, so an identical body changes nothing.
+        if body != _last_uploaded_body:
+            try:
+                _write_supabase_state_unlocked(body)
+            except RuntimeError:
+                # A rejected write leaves the row in an unknown state: refetch
+                # it on the next read and never skip the next upload.
+                _last_uploaded_body = None
+                _last_uploaded_state = None
+                _invalidate_state_read_cache()
+                raise
+            _last_uploaded_body = body
+        _last_uploaded_state = (persisted, data)
+        _uploaded_write_sequence = sequence
 
 
 def _write_data_unlocked(data):
-    _get_storage_backend()
-    _write_supabase_state_unlocked(data)
-    _invalidate_state_read_cache()
+    global _inflight_write_data
+    backend = _get_storage_backend()
+    # Writers load from the pending state, so this write supersedes it.
+    _clear_pending_write_unlocked()
+    _upload_state(data, _next_write_sequence_unlocked())
+    # An upload still in flight carries older state; it must not be published
+    # or served to writers once this one is stored.
+    _inflight_write_data = None
+    # Write through so the next read or write does not refetch what we just stored.
+    _set_state_read_cache_unlocked(backend, data)
+
+
+def _unflushed_state_unlocked():
+    if _pending_write_data is not None:
+        return _pending_write_data
+    return _inflight_write_data
+
+
+def _clear_pending_write_unlocked():
+    global _pending_write_data, _pending_write_timer, _pending_write_count, _pending_write_flush_due
+    if _pending_write_timer is not None:
+        _pending_write_timer.cancel()
+    _pending_write_data = None
+    _pending_write_timer = None
+    _pending_write_count = 0
+    _pending_write_flush_due = False
+
+
+def _schedule_write_unlocked(data):
+    # Debounce bursts of table actions into one upload; reads and writers see
+    # the pending state until it is flushed.
+    global _pending_write_data, _pending_write_timer, _pending_write_count, _pending_write_first_at
+    global _pending_write_flush_due
+    if not _state_cache_is_authoritative(_get_storage_backend()):
+        # Writers refetch the row when other instances may write it, which
+        # would drop a pending state; upload now instead.
+        _write_data_unlocked(data)
+        return
+    now = time.monotonic()
+    if _pending_write_data is None:
+        _pending_write_first_at = now
+    _pending_write_data = data
+    _pending_write_count += 1
+    if _pending_write_timer is not None:
+        _pending_write_timer.cancel()
+        _pending_write_timer = None
+    if (
+        _pending_write_count >= _WRITE_BATCH_MAX_MUTATIONS
+        or now - _pending_write_first_at >= _WRITE_BATCH_MAX_SECONDS
+    ):
+        # Flushed by _accounts_write_lock on release; the timer stays armed
+        # in case the lock is still held by an outer caller for a while.
+        _pending_write_flush_due = True
+    _pending_write_timer = threading.Timer(_WRITE_DEBOUNCE_SECONDS, _flush_pending_writes_in_background)
+    _pending_write_timer.daemon = True
+    _pending_write_timer.start()
+
+
+def _retry_pending_write_unlocked():
+    global _pending_write_retry_seconds, _pending_write_timer
+    # Back off so an unavailable Supabase is not hammered by the retries.
+    _pending_write_retry_seconds = min(
+        _WRITE_RETRY_MAX_SECONDS, max(_WRITE_DEBOUNCE_SECONDS, _pending_write_retry_seconds * 2)
+    )
+    if _pending_write_timer is not None:
+        _pending_write_timer.cancel()
+    _pending_write_timer = threading.Timer(_pending_write_retry_seconds, _flush_pending_writes_in_background)
+    _pending_write_timer.daemon = True
+    _pending_write_timer.start()
+
+
+def _flush_pending_writes_in_background():
+    try:
+        flush_pending_writes()
+    except RuntimeError as exc:
+        # The state stays pending and the re-armed timer retries it; other
+        # callers' writes are not failed for it. An explicit
+        # flush_pending_writes() still raises while the upload keeps failing.
+        _logger.warning("Background state upload failed; retrying: %s", exc)
+
+
+def flush_pending_writes():
+    global _pending_write_data, _inflight_write_data, _pending_write_retry_seconds
+    with _in_process_write_lock:
+        data = _pending_write_data
+        if data is None:
+            return
+        sequence = _next_write_sequence_unlocked()
+        _clear_pending_write_unlocked()
+        # Keep the state visible to readers and writers while it uploads.
+        _inflight_write_data = data
+    uploaded = False
+    try:
+        _upload_state(data, sequence)
+        uploaded = True
+    finally:
+        with _in_process_write_lock:
+            if _inflight_write_data is data:
+                _inflight_write_data = None
+                if uploaded:
+                    _pending_write_retry_seconds = 0.0
+                    if _state_write_sequence == sequence:
+                        # A newer write may have uploaded first; only the
+                        # latest state is written through to the read cache.
+                        _set_state_read_cache_unlocked(_get_storage_backend(), data)
+                elif _pending_write_data is None and _state_write_sequence == sequence:
+                    # Nothing newer replaced it; keep it pending and retry.
+                    _pending_write_data = data
+                    _retry_pending_write_unlocked()
+
+
+atexit.register(flush_pending_writes)
 
 
 def _write_data(data):
@@ -430,7 +850,7 @@ def _normalize_loaded_data(loaded):
             data["accounts"][name] = normalized_account
     data["active_sessions"] = _normalize_active_sessions(
         loaded.get("active_sessions", {}),
-        set(data["accounts"].keys()),
+        data["accounts"].keys(),
     )
 
     raw_limits = loaded.get("game_limits")
@@ -468,16 +888,59 @@ def _normalize_loaded_data(loaded):
 
 def _load_data_unlocked(use_cache=True):
     backend = _get_storage_backend()
-    if use_cache and _is_cached_state_valid_unlocked(backend):
+    unflushed = _unflushed_state_unlocked()
+    if unflushed is not None:
+        return unflushed
+    # Bind the entry once: lock-free readers race with writers replacing it.
+    cache_entry = _state_read_cache
+    if use_cache and _is_cached_state_valid_unlocked(backend, cache_entry):
         # Return the cached normalized state directly to avoid repeatedly
         # deep-copying the full app state on every read helper call.
-        return _state_read_cache.get("data")
+        return cache_entry.get("data")
+    # Concurrent cold reads share one round trip: callers that queued behind
+    # an in-flight fetch pick up the state it just cached.
+    with _supabase_read_lock:
+        if use_cache:
+            unflushed = _unflushed_state_unlocked()
+            if unflushed is not None:
+                return unflushed
+            cache_entry = _state_read_cache
+            if _is_cached_state_valid_unlocked(backend, cache_entry):
+                return cache_entry.get("data")
+        return _fetch_state_unlocked(backend)
+
+
+def _fetch_state_unlocked(backend):
+    global _last_read_state, _last_uploaded_body
     try:
-        loaded = _read_supabase_state_unlocked()
-        if loaded is None:
-            _set_state_read_cache_unlocked(backend, None)
-            return None
-        normalized = _normalize_loaded_data(loaded)
+        raw = _read_supabase_state_body_unlocked()
+        # An unchanged row (the usual case when the TTL lapses without another
+        # writer) reuses the state normalized from the identical body last time.
+        last_read = _last_read_state
+        if last_read is not None and last_read[0] == raw:
+            normalized = last_read[1]
+            # The row may have been written back to this body after our last
+            # upload; unless the body is that upload, it must not be skipped.
+            last_uploaded = _last_uploaded_state
+            if last_uploaded is None or normalized is not last_uploaded[1]:
+                _last_uploaded_body = None
+        else:
+            loaded = _decode_supabase_state(raw)
+            if loaded is None:
+                _last_uploaded_body = None
+                _set_state_read_cache_unlocked(backend, None)
+                return None
+            # The first read after our own write usually returns exactly what
+            # we uploaded; the state we normalized before writing it is reused.
+            last_uploaded = _last_uploaded_state
+            if last_uploaded is not None and loaded == last_uploaded[0]:
+                normalized = last_uploaded[1]
+            else:
+                # Another writer replaced the row, so it no longer holds our
+                # last upload and an identical body must not be skipped.
+                _last_uploaded_body = None
+                normalized = _normalize_loaded_data(loaded)
+            _last_read_state = (raw, normalized)
         _set_state_read_cache_unlocked(backend, normalized)
         return normalized
     except (json.JSONDecodeError, ValueError):
@@ -493,10 +956,66 @@ def _load_data():
 
 
 def _load_data_for_write_unlocked():
+    unflushed = _unflushed_state_unlocked()
+    if unflushed is not None:
+        # Published pending state must stay untouched until it is flushed.
+        return deepcopy(unflushed)
+    backend = _get_storage_backend()
+    cache_entry = _state_read_cache
+    if _state_cache_is_authoritative(backend) and _is_cached_state_valid_unlocked(backend, cache_entry):
+        # As the sole writer, our own write-through is the row, which saves a
+        # Supabase round trip and a re-normalization on back-to-back mutations.
+        cached = cache_entry.get("data")
+        return deepcopy(cached) if cached is not None else _default_data()
     data = _load_data_unlocked(use_cache=False)
     if data is None:
         return _default_data()
-    return data
+    # The fresh load is now also the cached state, so the caller needs its own copy.
+    return deepcopy(data)
+
+
+def _load_poker_table_for_write_unlocked(table_id):
+    # Copy-on-write for single-table mutations: the poker state containers and
+    # the one table are copied; accounts and every other table stay shared
+    # with the published state. Returns (data, lan_state, table or None).
+    published = _load_data_unlocked(use_cache=_state_cache_is_authoritative(_get_storage_backend()))
+    published_lan_state = published.get("poker_lan") if published is not None else None
+    if (
+        not isinstance(published_lan_state, dict)
+        or published_lan_state.get("_normalized_version") != _POKER_LAN_NORMALIZE_VERSION
+        or published_lan_state.get("_tables_by_id") is None
+    ):
+        data = _load_data_for_write_unlocked()
+        lan_state = _normalize_poker_lan_state(data.get("poker_lan", {}))
+        return data, lan_state, _poker_lan_table_by_id(lan_state, table_id)
+    data = dict(published)
+    lan_state = dict(published_lan_state)
+    lan_state["_tables_by_id"] = dict(published_lan_state["_tables_by_id"])
+    name_index = published_lan_state.get("_name_index")
+    if name_index is not None:
+        lan_state["_name_index"] = dict(name_index)
+    data["poker_lan"] = lan_state
+    shared_table = lan_state["_tables_by_id"].get(_poker_table_id_key(table_id))
+    if shared_table is None:
+        return data, lan_state, None
+    table = deepcopy(shared_table)
+    lan_state["tables"] = [table if entry is shared_table else entry for entry in published_lan_state["tables"]]
+    lan_state["_tables_by_id"][int(table["id"])] = table
+    return data, lan_state, table
+
+
+def _load_account_for_write_unlocked(name):
+    # Copy-on-write for single-account mutations: only the containers on the
+    # path to that account are copied; everything else stays shared with the
+    # published state, which is never mutated in place.
+    published = _load_data_unlocked(use_cache=_state_cache_is_authoritative(_get_storage_backend()))
+    data = dict(published) if published is not None else _default_data()
+    data["accounts"] = dict(data["accounts"])
+    account = data["accounts"].get(name)
+    if account is not None:
+        account = deepcopy(account)
+        data["accounts"][name] = account
+    return data, account
 
 
 def load_saved_odds():
@@ -519,41 +1038,9 @@ def save_odds(value):
 
 def load_game_limits():
     # Load saved game limits from persistent JSON, falling back to defaults.
+    # Limits are normalized once when state is loaded.
     data = _load_data()
-    saved = data.get("game_limits", _default_game_limits())
-    normalized = _default_game_limits()
-    
-    # Normalize max_range
-    try:
-        max_range = saved.get("max_range")
-        if max_range is not None:
-            max_range = int(max_range)
-            if max_range > 0:
-                normalized["max_range"] = max_range
-    except (TypeError, ValueError):
-        pass
-    
-    # Normalize max_buy_in
-    try:
-        max_buy_in = saved.get("max_buy_in")
-        if max_buy_in is not None:
-            max_buy_in = float(max_buy_in)
-            if max_buy_in > 0:
-                normalized["max_buy_in"] = max_buy_in
-    except (TypeError, ValueError):
-        pass
-    
-    # Normalize max_guesses
-    try:
-        max_guesses = saved.get("max_guesses")
-        if max_guesses is not None:
-            max_guesses = int(max_guesses)
-            if max_guesses > 0:
-                normalized["max_guesses"] = max_guesses
-    except (TypeError, ValueError):
-        pass
-    
-    return normalized
+    return dict(data.get("game_limits") or _default_game_limits())
 
 
 def save_game_limits(max_range, max_buy_in, max_guesses):
@@ -619,8 +1106,7 @@ def get_account_password(name):
 def set_account_password(name, password):
     # Persist password for an existing account.
     with _accounts_write_lock():
-        data = _load_data_for_write_unlocked()
-        account = data["accounts"].get(name)
+        data, account = _load_account_for_write_unlocked(name)
         if account is None:
             return False
         account["password"] = password
@@ -631,8 +1117,7 @@ def set_account_password(name, password):
 def add_account_value(name, amount):
     # Add (or subtract) value from one account and persist file.
     with _accounts_write_lock():
-        data = _load_data_for_write_unlocked()
-        account = data["accounts"].get(name)
+        data, account = _load_account_for_write_unlocked(name)
         if account is None:
             return False
         delta = house_round_delta(amount)
@@ -648,8 +1133,7 @@ def list_account_names():
 
 def set_account_value(name, new_balance):
     with _accounts_write_lock():
-        data = _load_data_for_write_unlocked()
-        account = data["accounts"].get(name)
+        data, account = _load_account_for_write_unlocked(name)
         if account is None:
             return False, 0.0
         normalized_balance = house_round_balance(new_balance)
@@ -662,8 +1146,8 @@ def create_account_record(name, initial_balance, password=""):
     if is_reserved_account_name(name):
         return False
     with _accounts_write_lock():
-        data = _load_data_for_write_unlocked()
-        if name in data["accounts"]:
+        data, existing_account = _load_account_for_write_unlocked(name)
+        if existing_account is not None:
             return False
         data["accounts"][name] = {
             "balance": house_round_credit(initial_balance),
@@ -688,8 +1172,7 @@ def set_account_admin_status(name, is_admin):
     if is_reserved_account_name(name):
         return False
     with _accounts_write_lock():
-        data = _load_data_for_write_unlocked()
-        account = data["accounts"].get(name)
+        data, account = _load_account_for_write_unlocked(name)
         if account is None:
             return False
         account["is_admin"] = bool(is_admin)
@@ -708,7 +1191,7 @@ def delete_account(name):
         sessions = data.setdefault("active_sessions", {})
         sessions.pop(name, None)
         poker_lan_state = _normalize_poker_lan_state(data.get("poker_lan", {}))
-        _poker_remove_player_from_all_tables_unlocked(data, poker_lan_state, name, allow_in_hand=True)
+        _poker_remove_player_from_all_tables_unlocked(data, poker_lan_state, sys.intern(name), allow_in_hand=True)
         data["poker_lan"] = poker_lan_state
         _write_data_unlocked(data)
         return True
@@ -722,6 +1205,18 @@ def acquire_account_session(name, session_id, ttl_seconds=DEFAULT_ACCOUNT_SESSIO
     ttl = _coerce_session_ttl_seconds(ttl_seconds)
     now_epoch = time.time()
 
+    # Fast path without the write lock: the session is already ours and was
+    # refreshed recently, so there is nothing worth persisting yet.
+    snapshot = _load_data()
+    existing_entry = snapshot.get("active_sessions", {}).get(name)
+    if (
+        name in snapshot["accounts"]
+        and isinstance(existing_entry, dict)
+        and existing_entry.get("session_id") == normalized_session_id
+        and now_epoch - float(existing_entry.get("last_seen_epoch", 0.0)) < min(ACCOUNT_SESSION_REFRESH_SECONDS, ttl / 2)
+    ):
+        return True, "acquired"
+
     with _accounts_write_lock():
         data = _load_data_for_write_unlocked()
         if name not in data["accounts"]:
@@ -779,8 +1274,11 @@ def release_account_session(name, session_id):
 
 def _normalize_game_type(game_type):
     if isinstance(game_type, str):
+        # Callers almost always pass a canonical key, which skips the string work.
+        if game_type in _GAME_STAT_KEY_SET:
+            return game_type
         normalized = game_type.strip().lower()
-        if normalized in GAME_STAT_KEYS:
+        if normalized in _GAME_STAT_KEY_SET:
             return normalized
     return None
 
@@ -790,11 +1288,11 @@ def get_account_stats(name, game_type=None):
     account = data["accounts"].get(name)
     if account is None:
         return None
-    stats = _normalize_account_stats(account.get("stats", {}))
+    stats = account["stats"]
     selected_game_type = _normalize_game_type(game_type)
     if selected_game_type is None:
-        return stats
-    return _normalize_stats_bucket(stats.get("game_breakdown", {}).get(selected_game_type, {}))
+        return _public_account_stats(stats)
+    return _public_stats_bucket(stats["game_breakdown"][selected_game_type])
 
 
 def get_storage_backend_type():
@@ -803,28 +1301,35 @@ def get_storage_backend_type():
 
 
 def get_accounts_snapshot(game_type=None):
+    global _accounts_snapshot_cache
     data = _load_data()
     selected_game_type = _normalize_game_type(game_type)
+    accounts = data["accounts"]
+    # Published account maps are never mutated in place, so a view built from
+    # the same map object is still current. Callers get their own copies.
+    cache_entry = _accounts_snapshot_cache
+    if cache_entry is not None and cache_entry[0] is accounts and cache_entry[1] == selected_game_type:
+        snapshot = cache_entry[2]
+    else:
+        snapshot = _build_accounts_snapshot(accounts, selected_game_type)
+        _accounts_snapshot_cache = (accounts, selected_game_type, snapshot)
+    return {name: {"balance": entry["balance"], "stats": dict(entry["stats"])} for name, entry in snapshot.items()}
+
+
+def _build_accounts_snapshot(accounts, selected_game_type):
     snapshot = {}
-    for name, account in data["accounts"].items():
+    for name, account in accounts.items():
         if is_reserved_account_name(name):
             continue
-        if not isinstance(account, dict):
-            continue
-        try:
-            balance = house_round_balance(float(account.get("balance", 0.0)))
-        except (TypeError, ValueError):
-            balance = 0.0
-        account_stats = _normalize_account_stats(account.get("stats", {}))
+        # Accounts are normalized once when state is loaded.
+        account_stats = account["stats"]
         if selected_game_type is None:
-            scoped_stats = _normalize_stats_bucket(account_stats)
+            scoped_stats = account_stats
         else:
-            scoped_stats = _normalize_stats_bucket(
-                account_stats.get("game_breakdown", {}).get(selected_game_type, {})
-            )
+            scoped_stats = account_stats["game_breakdown"][selected_game_type]
         snapshot[name] = {
-            "balance": float(balance),
-            "stats": scoped_stats,
+            "balance": float(account["balance"]),
+            "stats": _public_stats_bucket(scoped_stats),
         }
     return snapshot
 
@@ -834,13 +1339,12 @@ def get_account_settings(name):
     account = data["accounts"].get(name)
     if account is None:
         return None
-    return _normalize_account_settings(account.get("settings", {}))
+    return dict(account["settings"])
 
 
 def set_account_settings(name, settings):
     with _accounts_write_lock():
-        data = _load_data_for_write_unlocked()
-        account = data["accounts"].get(name)
+        data, account = _load_account_for_write_unlocked(name)
         if account is None:
             return False
         account["settings"] = _normalize_account_settings(settings)
@@ -848,42 +1352,37 @@ def set_account_settings(name, settings):
         return True
 
 
-def _apply_result_to_stats_bucket(stats, buy_in, payout, won):
-    buy_in_value = house_round_delta(buy_in)
-    payout_value = house_round_delta(payout)
-    net_value = house_round_balance(payout_value - buy_in_value)
+def _apply_result_to_stats_bucket(stats, buy_in_cents, payout_cents, won):
+    rounds_played = stats["rounds_played"] + 1
+    rounds_won = stats["rounds_won"] + 1 if won else stats["rounds_won"]
+    stats["rounds_played"] = rounds_played
+    stats["rounds_won"] = rounds_won
+    stats["total_game_buy_in_cents"] += buy_in_cents
+    stats["total_game_payout_cents"] += payout_cents
+    stats["total_game_net_cents"] += payout_cents - buy_in_cents
+    # rounds_played is at least one here, so no zero-rounds branch is needed.
+    stats["current_win_percentage"] = (rounds_won / rounds_played) * 100.0
 
-    stats["rounds_played"] += 1
-    if won:
-        stats["rounds_won"] += 1
-    stats["total_game_buy_in"] = house_round_balance(stats["total_game_buy_in"] + buy_in_value)
-    stats["total_game_payout"] = house_round_balance(stats["total_game_payout"] + payout_value)
-    stats["total_game_net"] = house_round_balance(stats["total_game_net"] + net_value)
 
-    if stats["rounds_played"] > 0:
-        stats["current_win_percentage"] = (stats["rounds_won"] / stats["rounds_played"]) * 100.0
-    else:
-        stats["current_win_percentage"] = 0.0
+def _record_account_result(account, buy_in, payout, won, game_type):
+    # Loaded accounts always carry normalized stats with every game bucket,
+    # so results are applied in place without rebuilding the stats tree.
+    # Amounts are rounded to cents once and shared by both buckets.
+    buy_in_cents = _to_cents(buy_in)
+    payout_cents = _to_cents(payout)
+    stats = account["stats"]
+    _apply_result_to_stats_bucket(stats, buy_in_cents, payout_cents, won)
+    if game_type is not None:
+        _apply_result_to_stats_bucket(stats["game_breakdown"][game_type], buy_in_cents, payout_cents, won)
 
 
 def record_game_result(name, buy_in, payout, won, game_type=None):
     with _accounts_write_lock():
-        data = _load_data_for_write_unlocked()
-        account = data["accounts"].get(name)
+        data, account = _load_account_for_write_unlocked(name)
         if account is None:
             return False
 
-        stats = _normalize_account_stats(account.get("stats", {}))
-        _apply_result_to_stats_bucket(stats, buy_in, payout, won)
-        selected_game_type = _normalize_game_type(game_type)
-        if selected_game_type is not None:
-            breakdown = stats.get("game_breakdown", {})
-            game_stats = _normalize_stats_bucket(breakdown.get(selected_game_type, {}))
-            _apply_result_to_stats_bucket(game_stats, buy_in, payout, won)
-            breakdown[selected_game_type] = game_stats
-            stats["game_breakdown"] = breakdown
-
-        account["stats"] = stats
+        _record_account_result(account, buy_in, payout, won, _normalize_game_type(game_type))
         _write_data_unlocked(data)
         return True
 
@@ -897,26 +1396,38 @@ POKER_LAN_DEFAULT_BIG_BLIND = 2.0
 POKER_LAN_DEFAULT_MIN_RAISE = 0.01
 POKER_LAN_MAX_BOTS_PER_TABLE = 3
 POKER_LAN_DEFAULT_TURN_TIMEOUT_SECONDS = 30
+POKER_LAN_HISTORY_LIMIT = 40
 POKER_LAN_PHASE_WAITING = "waiting_ready"
 POKER_LAN_PHASE_IN_HAND = "in_hand"
 POKER_LAN_PHASE_FINISHED = "finished"
+_POKER_LAN_PHASES = {
+    phase: phase for phase in (POKER_LAN_PHASE_WAITING, POKER_LAN_PHASE_IN_HAND, POKER_LAN_PHASE_FINISHED)
+}
+# Action names poker_engine.apply_action understands.
+_POKER_ENGINE_ACTIONS = frozenset(("fold", "check", "call", "bet", "raise", "all_in"))
+_POKER_LAN_NORMALIZE_VERSION = 1
+# (settings, {table_id: table}) from the last normalization of loaded state.
+_poker_lan_table_memo = None
 POKER_BOT_FIRST_NAMES = [
     "Liam", "Noah", "Milo", "Owen", "Ezra", "Aiden", "Leo", "Eli", "Nora", "Luna",
     "Maya", "Zoe", "Ivy", "Aria", "Ava", "Nina", "Emma", "Chloe", "Ruby", "Mia", "Austin", "James", "Elijah", "Benjamin", "Lucas", "Henry", "Alexander", "Jack", "Sebastian", "Ethan", "Jacob", "Michael", "Daniel", "Logan", "Jackson", "Levi",
 ]
 
 
+_POKER_LAN_SETTINGS_TEMPLATE = {
+    "default_max_players": POKER_LAN_DEFAULT_MAX_PLAYERS,
+    "default_min_buy_in": POKER_LAN_DEFAULT_MIN_BUY_IN,
+    "default_max_buy_in": POKER_LAN_DEFAULT_MAX_BUY_IN,
+    "default_small_blind": POKER_LAN_DEFAULT_SMALL_BLIND,
+    "default_big_blind": POKER_LAN_DEFAULT_BIG_BLIND,
+    "default_min_raise": POKER_LAN_DEFAULT_MIN_RAISE,
+    "allow_spectators_by_default": True,
+    "turn_timeout_seconds": POKER_LAN_DEFAULT_TURN_TIMEOUT_SECONDS,
+}
+
+
 def _default_poker_lan_settings():
-    return {
-        "default_max_players": POKER_LAN_DEFAULT_MAX_PLAYERS,
-        "default_min_buy_in": POKER_LAN_DEFAULT_MIN_BUY_IN,
-        "default_max_buy_in": POKER_LAN_DEFAULT_MAX_BUY_IN,
-        "default_small_blind": POKER_LAN_DEFAULT_SMALL_BLIND,
-        "default_big_blind": POKER_LAN_DEFAULT_BIG_BLIND,
-        "default_min_raise": POKER_LAN_DEFAULT_MIN_RAISE,
-        "allow_spectators_by_default": True,
-        "turn_timeout_seconds": POKER_LAN_DEFAULT_TURN_TIMEOUT_SECONDS,
-    }
+    return _POKER_LAN_SETTINGS_TEMPLATE.copy()
 
 
 def _coerce_poker_currency(raw_value, fallback, allow_none=False):
@@ -942,11 +1453,34 @@ def _coerce_poker_turn_timeout(raw_value, fallback):
     return max(5, value)
 
 
+def _clamp_int(raw_value, low, high, fallback):
+    if type(raw_value) is not int:
+        try:
+            raw_value = int(raw_value)
+        except (TypeError, ValueError):
+            return fallback
+    if raw_value < low:
+        return low
+    if raw_value > high:
+        return high
+    return raw_value
+
+
+def _poker_lan_max_bots(max_players):
+    # At least one seat is always left for a human.
+    return min(POKER_LAN_MAX_BOTS_PER_TABLE, max(0, int(max_players) - 1))
+
+
 def _normalize_poker_lan_settings(raw_settings):
     settings = _default_poker_lan_settings()
     if not isinstance(raw_settings, dict):
         return settings
-    settings["default_max_players"] = max(2, min(6, int(raw_settings.get("default_max_players", settings["default_max_players"]))))
+    settings["default_max_players"] = _clamp_int(
+        raw_settings.get("default_max_players", settings["default_max_players"]),
+        2,
+        6,
+        settings["default_max_players"],
+    )
     settings["default_min_buy_in"] = _coerce_poker_currency(
         raw_settings.get("default_min_buy_in", settings["default_min_buy_in"]),
         settings["default_min_buy_in"],
@@ -986,7 +1520,13 @@ def _normalize_poker_lan_table_name(name, fallback_id):
 
 
 def _poker_random_bot_name(existing_names=None):
-    blocked = set(existing_names or [])
+    # Callers pass the set of taken names, which is probed directly; a few
+    # random draws almost always find a free name without shuffling the pool.
+    blocked = existing_names if isinstance(existing_names, (set, frozenset)) else set(existing_names or [])
+    for _attempt in range(8):
+        name = random.choice(POKER_BOT_FIRST_NAMES)
+        if name not in blocked:
+            return name
     shuffled = list(POKER_BOT_FIRST_NAMES)
     random.shuffle(shuffled)
     for name in shuffled:
@@ -1001,34 +1541,51 @@ def _poker_random_bot_name(existing_names=None):
 
 
 def _poker_is_bot_name(player_name, table=None):
-    text = str(player_name or "").strip().lower()
+    # Stored names are already stripped strings, for which strip() returns the
+    # same object; only the four-character prefix is lowercased.
+    if isinstance(player_name, str):
+        text = player_name.strip()
+    else:
+        text = str(player_name or "").strip()
     if isinstance(table, dict):
         bot_players = table.get("bot_players", [])
-        if isinstance(bot_players, list) and str(player_name or "").strip() in bot_players:
+        if isinstance(bot_players, list) and text in bot_players:
             return True
-    return text.startswith("bot_")
+    return text[:4].lower() == "bot_"
+
+
+def _poker_table_bot_set(table):
+    # Transient set of the seated bots; dropped with _players_set whenever
+    # seats change, and bot_players only changes alongside the seats.
+    bot_set = table.get("_bot_set")
+    if bot_set is None:
+        bot_players = set(table.get("bot_players") or ())
+        # Seated names are normalized (stripped, interned strings), so the
+        # prefix half of _poker_is_bot_name is applied to them directly.
+        bot_set = {
+            name for name in table.get("players", []) if name in bot_players or name[:4].lower() == "bot_"
+        }
+        table["_bot_set"] = bot_set
+    return bot_set
 
 
 def _poker_table_human_players(table):
-    humans = []
-    for name in table.get("players", []):
-        text = str(name).strip()
-        if not text or _poker_is_bot_name(text, table):
-            continue
-        humans.append(text)
-    return humans
+    # Seated names are stored stripped and non-empty.
+    bot_set = _poker_table_bot_set(table)
+    return [name for name in table.get("players", []) if name not in bot_set]
 
 
-def _poker_refresh_bot_names_unlocked(table):
+def _poker_refresh_bot_names_unlocked(table, now_epoch=None):
     if not isinstance(table, dict):
         return
     if bool(table.get("in_progress", False)):
         return
-    players = list(table.get("players", []))
-    bot_names = [name for name in players if _poker_is_bot_name(name, table)]
-    if not bot_names:
+    bot_set = _poker_table_bot_set(table)
+    if not bot_set:
         return
-    humans = [name for name in players if not _poker_is_bot_name(name, table)]
+    players = list(table.get("players", []))
+    bot_names = [name for name in players if name in bot_set]
+    humans = [name for name in players if name not in bot_set]
     existing = set(humans)
     mapping = {}
     for old_name in bot_names:
@@ -1036,6 +1593,7 @@ def _poker_refresh_bot_names_unlocked(table):
         existing.add(new_name)
         mapping[old_name] = new_name
     table["players"] = [mapping.get(name, name) for name in players]
+    _poker_table_players_changed(table)
     table["bot_players"] = [mapping.get(name, name) for name in table.get("bot_players", [])]
     table["pending_players"] = [mapping.get(name, name) for name in table.get("pending_players", [])]
 
@@ -1049,20 +1607,32 @@ def _poker_refresh_bot_names_unlocked(table):
     if table.get("host") in mapping or _poker_is_bot_name(table.get("host"), table):
         human_players = _poker_table_human_players(table)
         table["host"] = human_players[0] if human_players else None
-    table["last_updated_epoch"] = time.time()
+    table["last_updated_epoch"] = time.time() if now_epoch is None else now_epoch
 
 
-def _default_poker_lan_table(table_id, settings=None):
+_poker_lan_table_templates = {}
+
+
+def _poker_lan_table_template(settings):
+    # Flat template of the settings-derived defaults, built once per distinct
+    # settings dict. Container fields are placeholders filled per table.
+    try:
+        key = tuple(settings.items()) if isinstance(settings, dict) else ()
+        template = _poker_lan_table_templates.get(key)
+    except TypeError:
+        key, template = None, None
+    if template is not None:
+        return template
     normalized_settings = _normalize_poker_lan_settings(settings or {})
-    return {
-        "id": int(table_id),
-        "name": _normalize_poker_lan_table_name(None, table_id),
+    template = {
+        "id": 0,
+        "name": "",
         "host": None,
-        "players": [],
-        "pending_players": [],
-        "bot_players": [],
+        "players": None,
+        "pending_players": None,
+        "bot_players": None,
         "bot_count": 0,
-        "player_states": {},
+        "player_states": None,
         "max_players": int(normalized_settings["default_max_players"]),
         "min_buy_in": float(normalized_settings["default_min_buy_in"]),
         "max_buy_in": float(normalized_settings["default_max_buy_in"]),
@@ -1078,20 +1648,57 @@ def _default_poker_lan_table(table_id, settings=None):
         "round": 0,
         "dealer_index": 0,
         "hand_state": None,
-        "hand_start_stacks": {},
+        "hand_start_stacks": None,
         "turn_started_epoch": 0.0,
         "turn_timeout_seconds": int(normalized_settings["turn_timeout_seconds"]),
-        "history": [],
+        "history": None,
         "last_updated_epoch": 0.0,
     }
+    if key is not None:
+        if len(_poker_lan_table_templates) >= 32:
+            _poker_lan_table_templates.clear()
+        _poker_lan_table_templates[key] = template
+    return template
+
+
+def _default_poker_lan_table(table_id, settings=None):
+    table = _poker_lan_table_template(settings).copy()
+    table["id"] = int(table_id)
+    table["name"] = _normalize_poker_lan_table_name(None, table_id)
+    table["players"] = []
+    table["pending_players"] = []
+    table["bot_players"] = []
+    table["player_states"] = {}
+    table["hand_start_stacks"] = {}
+    table["history"] = []
+    return table
+
+
+_POKER_PLAYER_STATE_PROTOTYPE = {
+    "stack_cents": 0,
+    "ready": False,
+    "last_hand_delta_cents": 0,
+}
+
+
+def _default_poker_player_state():
+    # All prototype values are immutable, so a flat copy is a full clone.
+    return _POKER_PLAYER_STATE_PROTOTYPE.copy()
+
+
+def _is_canonical_poker_player_state(raw_state):
+    return (
+        type(raw_state) is dict
+        and raw_state.keys() == _POKER_PLAYER_STATE_PROTOTYPE.keys()
+        and type(raw_state["stack_cents"]) is int
+        and raw_state["stack_cents"] >= 0
+        and type(raw_state["ready"]) is bool
+        and type(raw_state["last_hand_delta_cents"]) is int
+    )
 
 
 def _normalize_poker_player_state(raw_state):
-    state = {
-        "stack_cents": 0,
-        "ready": False,
-        "last_hand_delta_cents": 0,
-    }
+    state = _default_poker_player_state()
     if isinstance(raw_state, dict):
         try:
             state["stack_cents"] = max(0, int(raw_state.get("stack_cents", 0)))
@@ -1105,6 +1712,50 @@ def _normalize_poker_player_state(raw_state):
     return state
 
 
+def _normalize_poker_player_names(raw_names):
+    # Interned names let the many membership scans compare by identity first.
+    names = []
+    for name in raw_names:
+        text = str(name).strip()
+        if text:
+            names.append(sys.intern(text))
+    return names
+
+
+def _coerce_poker_flag(raw_value, _fallback):
+    # Takes a fallback only to share the _POKER_TABLE_SCALAR_FIELDS coercer
+    # signature; every value coerces to a bool.
+    return bool(raw_value)
+
+
+def _coerce_poker_counter(raw_value, fallback):
+    try:
+        return max(0, int(raw_value))
+    except (TypeError, ValueError):
+        return fallback
+
+
+def _coerce_poker_epoch(raw_value, fallback):
+    try:
+        return float(raw_value)
+    except (TypeError, ValueError):
+        return fallback
+
+
+# Independent scalar table fields and their coercers, applied in one loop;
+# fields whose bounds depend on other fields are normalized explicitly.
+_POKER_TABLE_SCALAR_FIELDS = (
+    ("allow_spectators", _coerce_poker_flag),
+    ("spectators_require_password", _coerce_poker_flag),
+    ("is_private", _coerce_poker_flag),
+    ("in_progress", _coerce_poker_flag),
+    ("round", _coerce_poker_counter),
+    ("dealer_index", _coerce_poker_counter),
+    ("turn_started_epoch", _coerce_poker_epoch),
+    ("last_updated_epoch", _coerce_poker_epoch),
+)
+
+
 def _normalize_poker_lan_table(raw_table, fallback_id, settings=None):
     table = _default_poker_lan_table(fallback_id, settings=settings)
     if not isinstance(raw_table, dict):
@@ -1117,26 +1768,18 @@ def _normalize_poker_lan_table(raw_table, fallback_id, settings=None):
     table["host"] = raw_table.get("host") if isinstance(raw_table.get("host"), str) else None
     raw_players = raw_table.get("players", [])
     if isinstance(raw_players, list):
-        table["players"] = [str(name).strip() for name in raw_players if str(name).strip()][: int(table["max_players"])]
+        table["players"] = _normalize_poker_player_names(raw_players)[: int(table["max_players"])]
     raw_pending = raw_table.get("pending_players", [])
     if isinstance(raw_pending, list):
-        table["pending_players"] = [str(name).strip() for name in raw_pending if str(name).strip()]
+        table["pending_players"] = _normalize_poker_player_names(raw_pending)
     raw_bot_players = raw_table.get("bot_players", [])
     if isinstance(raw_bot_players, list):
-        table["bot_players"] = [str(name).strip() for name in raw_bot_players if str(name).strip()]
+        table["bot_players"] = _normalize_poker_player_names(raw_bot_players)
     else:
         table["bot_players"] = [
             name for name in table.get("players", []) if str(name).strip().lower().startswith("bot_")
         ]
-    try:
-        table["max_players"] = max(2, min(6, int(raw_table.get("max_players", table["max_players"]))))
-    except (TypeError, ValueError):
-        pass
-    try:
-        max_bots = min(POKER_LAN_MAX_BOTS_PER_TABLE, max(0, int(table["max_players"]) - 1))
-        table["bot_count"] = max(0, min(max_bots, int(raw_table.get("bot_count", table.get("bot_count", 0)))))
-    except (TypeError, ValueError):
-        table["bot_count"] = 0
+    table["max_players"] = _clamp_int(raw_table.get("max_players", table["max_players"]), 2, 6, table["max_players"])
     table["min_buy_in"] = _coerce_poker_currency(raw_table.get("min_buy_in", table["min_buy_in"]), table["min_buy_in"])
     table["max_buy_in"] = _coerce_poker_currency(raw_table.get("max_buy_in", table["max_buy_in"]), table["max_buy_in"])
     if table["max_buy_in"] < table["min_buy_in"]:
@@ -1153,66 +1796,70 @@ def _normalize_poker_lan_table(raw_table, fallback_id, settings=None):
         0.01,
         _coerce_poker_currency(raw_table.get("min_raise", table["min_raise"]), table["min_raise"]),
     )
-    table["allow_spectators"] = bool(raw_table.get("allow_spectators", table["allow_spectators"]))
-    table["spectators_require_password"] = bool(
-        raw_table.get("spectators_require_password", table["spectators_require_password"])
-    )
-    table["is_private"] = bool(raw_table.get("is_private", table["is_private"]))
-    table["password"] = str(raw_table.get("password", "") or "")
-    table["phase"] = str(raw_table.get("phase", table["phase"]))
-    table["in_progress"] = bool(raw_table.get("in_progress", table["in_progress"]))
-    try:
-        table["round"] = max(0, int(raw_table.get("round", table["round"])))
-    except (TypeError, ValueError):
-        pass
-    try:
-        table["dealer_index"] = max(0, int(raw_table.get("dealer_index", table["dealer_index"])))
-    except (TypeError, ValueError):
-        pass
+    for key, coerce in _POKER_TABLE_SCALAR_FIELDS:
+        if key in raw_table:
+            table[key] = coerce(raw_table[key], table[key])
+    password = raw_table.get("password", "")
+    table["password"] = password if type(password) is str else str(password or "")
+    # Known phases map to the module constants, so loaded tables share them
+    # with in-memory ones; anything else is kept as its string form.
+    phase = raw_table.get("phase", table["phase"])
+    table["phase"] = _POKER_LAN_PHASES.get(phase, phase) if type(phase) is str else str(phase)
     if isinstance(raw_table.get("hand_state"), dict):
-        table["hand_state"] = raw_table.get("hand_state")
-    if isinstance(raw_table.get("hand_start_stacks"), dict):
-        normalized_stacks = {}
-        for name, value in raw_table.get("hand_start_stacks", {}).items():
-            if not isinstance(name, str):
-                continue
-            try:
-                normalized_stacks[str(name)] = int(value)
-            except (TypeError, ValueError):
-                continue
-        table["hand_start_stacks"] = normalized_stacks
-    try:
-        table["turn_started_epoch"] = float(raw_table.get("turn_started_epoch", table["turn_started_epoch"]))
-    except (TypeError, ValueError):
-        pass
+        table["hand_state"] = poker_restore_deck(raw_table.get("hand_state"))
+    raw_stacks = raw_table.get("hand_start_stacks")
+    if isinstance(raw_stacks, dict):
+        if all(type(name) is str and type(value) is int for name, value in raw_stacks.items()):
+            table["hand_start_stacks"] = raw_stacks
+        else:
+            normalized_stacks = {}
+            for name, value in raw_stacks.items():
+                if not isinstance(name, str):
+                    continue
+                try:
+                    normalized_stacks[str(name)] = int(value)
+                except (TypeError, ValueError):
+                    continue
+            table["hand_start_stacks"] = normalized_stacks
     table["turn_timeout_seconds"] = _coerce_poker_turn_timeout(
         raw_table.get("turn_timeout_seconds", table["turn_timeout_seconds"]),
         table["turn_timeout_seconds"],
     )
-    if isinstance(raw_table.get("history"), list):
-        table["history"] = [str(entry) for entry in raw_table.get("history", []) if isinstance(entry, str)][-40:]
-    try:
-        table["last_updated_epoch"] = float(raw_table.get("last_updated_epoch", table["last_updated_epoch"]))
-    except (TypeError, ValueError):
-        pass
+    raw_history = raw_table.get("history")
+    if isinstance(raw_history, list):
+        # Stored history is already capped plain strings, so the tail is
+        # usually the result; only mixed entries need the filtering pass.
+        history = raw_history[-POKER_LAN_HISTORY_LIMIT:]
+        if not all(type(entry) is str for entry in history):
+            history = [str(entry) for entry in raw_history if isinstance(entry, str)][-POKER_LAN_HISTORY_LIMIT:]
+        table["history"] = history
 
     raw_states = raw_table.get("player_states", {})
     normalized_states = {}
     if isinstance(raw_states, dict):
         for player_name in table["players"]:
-            normalized_states[player_name] = _normalize_poker_player_state(raw_states.get(player_name, {}))
+            raw_player_state = raw_states.get(player_name)
+            # States written by this version are trusted and reused as-is;
+            # only foreign or legacy shapes go through the coercing path.
+            if _is_canonical_poker_player_state(raw_player_state):
+                normalized_states[player_name] = raw_player_state
+            else:
+                normalized_states[player_name] = _normalize_poker_player_state(raw_player_state or {})
     for player_name in table["players"]:
-        normalized_states.setdefault(player_name, _normalize_poker_player_state({}))
+        normalized_states.setdefault(player_name, _default_poker_player_state())
     table["player_states"] = normalized_states
-    table["bot_players"] = [name for name in table.get("bot_players", []) if name in table.get("players", [])]
-    for player_name in table["players"]:
-        if _poker_is_bot_name(player_name, table):
-            table["player_states"][player_name]["ready"] = True
-    actual_bot_count = sum(1 for name in table.get("players", []) if _poker_is_bot_name(name, table))
-    max_bots = min(POKER_LAN_MAX_BOTS_PER_TABLE, max(0, int(table.get("max_players", 6)) - 1))
-    table["bot_count"] = max(0, min(max_bots, actual_bot_count))
-
-    if table["host"] not in table["players"] or _poker_is_bot_name(table["host"], table):
+    players_set = _poker_table_player_set(table)
+    bot_players = table["bot_players"]
+    if any(name not in players_set for name in bot_players):
+        table["bot_players"] = [name for name in bot_players if name in players_set]
+    bot_set = _poker_table_bot_set(table)
+    for player_name in bot_set:
+        normalized_states[player_name]["ready"] = True
+    # bot_count always reflects the seated bots; a stored value is never kept.
+    actual_bot_count = sum(1 for name in table["players"] if name in bot_set)
+    table["bot_count"] = min(_poker_lan_max_bots(table["max_players"]), actual_bot_count)
+
+    if table["host"] not in players_set or table["host"] in bot_set:
         humans = _poker_table_human_players(table)
         table["host"] = humans[0] if humans else None
 
@@ -1220,58 +1867,193 @@ def _normalize_poker_lan_table(raw_table, fallback_id, settings=None):
 
 
 def _default_poker_lan_state():
+    # Defaults are born normalized, so read helpers use them without the
+    # copy, re-normalize and compare-before-write fallback.
     settings = _default_poker_lan_settings()
-    return {
-        "settings": settings,
-        "tables": [_default_poker_lan_table(index + 1, settings=settings) for index in range(POKER_LAN_DEFAULT_TABLE_COUNT)],
-    }
+    tables = [_default_poker_lan_table(index + 1, settings=settings) for index in range(POKER_LAN_DEFAULT_TABLE_COUNT)]
+    return _finish_normalized_poker_lan_state({"settings": settings, "tables": tables})
+
+
+def _finish_normalized_poker_lan_state(state):
+    # Attach the transient indexes and the marker to an already normalized state.
+    state["_tables_by_id"] = {int(table["id"]): table for table in state["tables"]}
+    _poker_lan_name_index(state)
+    state["_normalized_version"] = _POKER_LAN_NORMALIZE_VERSION
+    return state
 
 
 def _normalize_poker_lan_state(raw_state):
-    state = _default_poker_lan_state()
+    # In-memory state that already went through this function is returned as is;
+    # the marker is stripped on persist, so freshly loaded state is always normalized.
+    if isinstance(raw_state, dict) and raw_state.get("_normalized_version") == _POKER_LAN_NORMALIZE_VERSION:
+        return raw_state
     if not isinstance(raw_state, dict):
-        return state
+        return _default_poker_lan_state()
+    global _poker_lan_table_memo
     settings = _normalize_poker_lan_settings(raw_state.get("settings", {}))
-    state["settings"] = settings
+    state = {"settings": settings}
+    # Tables whose stored form is unchanged since the last load reuse their
+    # previously normalized (and never mutated) copy.
+    memo = _poker_lan_table_memo
+    memo_tables = memo[1] if memo is not None and memo[0] == settings else {}
     raw_tables = raw_state.get("tables", [])
     normalized_tables = []
     if isinstance(raw_tables, list):
         for index, raw_table in enumerate(raw_tables):
-            normalized_tables.append(_normalize_poker_lan_table(raw_table, index + 1, settings=settings))
+            # Memoized tables are keyed by their normalized int id; any other
+            # stored id (possibly unhashable) is normalized from scratch.
+            raw_id = raw_table.get("id") if isinstance(raw_table, dict) else None
+            previous = memo_tables.get(raw_id) if type(raw_id) is int else None
+            # last_updated_epoch works as the table's revision stamp: a changed
+            # table is rejected on it before the full structural comparison.
+            if (
+                previous is not None
+                and raw_table.get("last_updated_epoch") == previous["last_updated_epoch"]
+                and raw_table == _persistable_poker_table(previous)
+            ):
+                normalized_tables.append(previous)
+            else:
+                normalized_tables.append(_normalize_poker_lan_table(raw_table, index + 1, settings=settings))
     if not normalized_tables:
         normalized_tables = [_default_poker_lan_table(index + 1, settings=settings) for index in range(POKER_LAN_DEFAULT_TABLE_COUNT)]
     by_id = {}
     for table in normalized_tables:
         by_id[int(table["id"])] = table
     state["tables"] = sorted(by_id.values(), key=lambda item: int(item.get("id", 0)))
+    _finish_normalized_poker_lan_state(state)
+    _poker_lan_table_memo = (settings, state["_tables_by_id"])
     return state
 
 
+def _poker_lan_tables_by_id(lan_state):
+    # Transient id -> table index; stripped before the state is persisted.
+    index = lan_state.get("_tables_by_id")
+    if index is None:
+        index = {int(table["id"]): table for table in lan_state.get("tables", [])}
+        lan_state["_tables_by_id"] = index
+    return index
+
+
+def _poker_lan_name_index(lan_state):
+    # Transient name -> id index; stripped before the state is persisted.
+    index = lan_state.get("_name_index")
+    if index is None:
+        index = {table["name"]: int(table["id"]) for table in lan_state.get("tables", [])}
+        lan_state["_name_index"] = index
+    return index
+
+
+def _strip_transient_keys(entry):
+    if not isinstance(entry, dict):
+        return entry
+    return {key: value for key, value in entry.items() if not key.startswith("_")}
+
+
+def _persistable_poker_table(table):
+    persisted = _strip_transient_keys(table)
+    hand_state = persisted.get("hand_state") if isinstance(persisted, dict) else None
+    if isinstance(hand_state, dict) and "deck_seed" in hand_state and "deck" in hand_state:
+        # The deck is rebuilt from its seed on load, so only seed and index are stored.
+        persisted["hand_state"] = {key: value for key, value in hand_state.items() if key != "deck"}
+    return persisted
+
+
+def _persistable_poker_lan_state(lan_state):
+    persisted = _strip_transient_keys(lan_state)
+    if isinstance(persisted, dict) and isinstance(persisted.get("tables"), list):
+        persisted["tables"] = [_persistable_poker_table(table) for table in persisted["tables"]]
+    return persisted
+
+
 def _poker_lan_next_table_id(lan_state):
-    max_id = 0
-    for table in lan_state.get("tables", []):
-        try:
-            max_id = max(max_id, int(table.get("id", 0)))
-        except (TypeError, ValueError):
-            pass
-    return max_id + 1
+    # The id index already holds every table id as an int.
+    return max(_poker_lan_tables_by_id(lan_state), default=0) + 1
 
 
-def _poker_lan_table_by_id(lan_state, table_id):
+def _poker_table_id_key(table_id):
+    # Index key for a caller-supplied table id, or None when it is not one.
+    if type(table_id) is int:
+        return table_id
     try:
-        normalized_id = int(table_id)
+        return int(table_id)
     except (TypeError, ValueError):
         return None
-    for table in lan_state.get("tables", []):
-        if int(table.get("id", -1)) == normalized_id:
-            return table
+
+
+def _poker_lan_table_by_id(lan_state, table_id):
+    return _poker_lan_tables_by_id(lan_state).get(_poker_table_id_key(table_id))
+
+
+def _peek_published_state():
+    # State already in memory (unflushed or a still-valid cache entry), or
+    # None. Never fetches: preflights that find nothing here skip straight to
+    # the locked path, which loads the row itself.
+    unflushed = _unflushed_state_unlocked()
+    if unflushed is not None:
+        return unflushed
+    cache_entry = _state_read_cache
+    if _is_cached_state_valid_unlocked(_get_storage_backend(), cache_entry):
+        return cache_entry.get("data")
     return None
 
 
+def _poker_lan_snapshot():
+    # Lock-free view of the published poker LAN state, or None when nothing
+    # valid is cached or it still needs normalizing under the write lock.
+    # Callers must not mutate it, including lazily built transient keys:
+    # writers deep-copy it concurrently.
+    data = _peek_published_state()
+    if data is None:
+        return None
+    lan_state = data.get("poker_lan")
+    if not isinstance(lan_state, dict) or lan_state.get("_normalized_version") != _POKER_LAN_NORMALIZE_VERSION:
+        return None
+    if lan_state.get("_tables_by_id") is None:
+        return None
+    return lan_state
+
+
+def _poker_lan_snapshot_member_state(table, player_name):
+    # Read-only twin of _poker_lan_table_member_state for snapshot tables: a
+    # seat set a writer already built is used, but never built here.
+    seated = table.get("_players_set")
+    if seated is None:
+        seated = table.get("players") or ()
+    if player_name in seated:
+        return "player"
+    if player_name in (table.get("pending_players") or ()):
+        return "pending"
+    return None
+
+
+def _poker_lan_snapshot_table(table_id):
+    # Lock-free lookup for preflight rejections only. Returns (checked, table);
+    # checked is False when the snapshot is not normalized yet, and callers
+    # must re-verify under the write lock before mutating anything.
+    lan_state = _poker_lan_snapshot()
+    if lan_state is None:
+        return False, None
+    return True, lan_state["_tables_by_id"].get(_poker_table_id_key(table_id))
+
+
+def _poker_table_player_set(table):
+    # Transient set mirror of table["players"]; dropped whenever seats change.
+    players_set = table.get("_players_set")
+    if players_set is None:
+        players_set = set(table.get("players", []))
+        table["_players_set"] = players_set
+    return players_set
+
+
+def _poker_table_players_changed(table):
+    table.pop("_players_set", None)
+    table.pop("_bot_set", None)
+
+
 def _poker_lan_table_member_state(table, player_name):
-    if player_name in table.get("players", []):
+    if player_name in _poker_table_player_set(table):
         return "player"
-    if player_name in table.get("pending_players", []):
+    if player_name in (table.get("pending_players") or ()):
         return "pending"
     return None
 
@@ -1279,59 +2061,74 @@ def _poker_lan_table_member_state(table, player_name):
 def _poker_lan_append_history(table, message):
     history = table.setdefault("history", [])
     history.append(str(message))
-    table["history"] = history[-40:]
+    # Trim in place so the list stays bounded without copying it per append.
+    overflow = len(history) - POKER_LAN_HISTORY_LIMIT
+    if overflow > 0:
+        del history[:overflow]
 
 
-def _poker_finalize_finished_hand_unlocked(data, table):
-    hand_state = table.get("hand_state")
+def _poker_finalize_finished_hand_unlocked(data, table, hand_state=None, player_states=None):
+    # Callers that already hold the table's hand state or player states pass
+    # them in; they are the table's own objects, not copies.
+    if hand_state is None:
+        hand_state = table.get("hand_state")
     if not isinstance(hand_state, dict):
         return
     if hand_state.get("street") != "finished":
         return
 
     players = hand_state.get("players", [])
+    if player_states is None:
+        player_states = table.setdefault("player_states", {})
+    start_stacks = table.get("hand_start_stacks", {})
+    # Callers may share accounts with the published state, so the map and
+    # each account that gets a result are copied before they are changed.
+    accounts = dict(data.get("accounts", {}))
+    data["accounts"] = accounts
     for player in players:
         player_name = player.get("name")
         if not isinstance(player_name, str):
             continue
         current_stack = int(player.get("stack", 0))
-        table.setdefault("player_states", {}).setdefault(player_name, _normalize_poker_player_state({}))
-        table["player_states"][player_name]["stack_cents"] = current_stack
-        start_stack = int(table.get("hand_start_stacks", {}).get(player_name, current_stack))
-        delta = current_stack - start_stack
-        table["player_states"][player_name]["last_hand_delta_cents"] = delta
-        account = data.get("accounts", {}).get(player_name)
+        player_state = player_states.get(player_name)
+        if player_state is None:
+            player_state = _default_poker_player_state()
+            player_states[player_name] = player_state
+        player_state["stack_cents"] = current_stack
+        delta = current_stack - int(start_stacks.get(player_name, current_stack))
+        player_state["last_hand_delta_cents"] = delta
+        account = accounts.get(player_name)
         if not isinstance(account, dict):
             continue
         buy_in = from_cents(max(0, -delta))
         payout = from_cents(max(0, delta))
         won = delta > 0
         if buy_in > 0 or payout > 0:
-            stats = _normalize_account_stats(account.get("stats", {}))
-            _apply_result_to_stats_bucket(stats, buy_in, payout, won)
-            breakdown = stats.get("game_breakdown", {})
-            poker_stats = _normalize_stats_bucket(breakdown.get("poker", {}))
-            _apply_result_to_stats_bucket(poker_stats, buy_in, payout, won)
-            breakdown["poker"] = poker_stats
-            stats["game_breakdown"] = breakdown
-            account["stats"] = stats
+            account = deepcopy(account)
+            accounts[player_name] = account
+            _record_account_result(account, buy_in, payout, won, "poker")
     table["phase"] = POKER_LAN_PHASE_FINISHED
     table["in_progress"] = False
 
 
-def _poker_run_bot_actions_unlocked(table):
-    hand_state = table.get("hand_state")
+def _poker_run_bot_actions_unlocked(table, hand_state=None):
+    if hand_state is None:
+        hand_state = table.get("hand_state")
     if not isinstance(hand_state, dict):
         return
+    # The engine updates the hand's player list in place and seats do not
+    # change while bots act, so both are bound once for the whole loop.
+    players = hand_state.get("players", [])
+    player_count = len(players)
+    bot_set = _poker_table_bot_set(table)
     while hand_state.get("street") != "finished":
         acting_index = hand_state.get("acting_index")
         if not isinstance(acting_index, int):
             break
-        players = hand_state.get("players", [])
-        if acting_index < 0 or acting_index >= len(players):
+        if acting_index < 0 or acting_index >= player_count:
             break
         acting_player = str(players[acting_index].get("name", "")).strip()
-        if not acting_player or (not _poker_is_bot_name(acting_player, table)):
+        if not acting_player or acting_player not in bot_set:
             break
         legal = poker_legal_actions(hand_state, acting_player)
         actions = legal.get("actions", [])
@@ -1342,11 +2139,17 @@ def _poker_run_bot_actions_unlocked(table):
         if not ok:
             poker_apply_action(hand_state, acting_player, "fold")
         _poker_lan_append_history(table, f"{acting_player}: {str(action).lower()}")
-    table["hand_state"] = hand_state
+
+
+def _poker_discard_name(names, player_name):
+    # Remove in place; absent names cost one scan and no list allocation.
+    while player_name in names:
+        names.remove(player_name)
 
 
 def _poker_remove_player_from_all_tables_unlocked(data, lan_state, player_name, allow_in_hand=False):
     removed = False
+    now_epoch = time.time()
     for table in lan_state.get("tables", []):
         if not isinstance(table, dict):
             continue
@@ -1356,109 +2159,155 @@ def _poker_remove_player_from_all_tables_unlocked(data, lan_state, player_name,
         if table.get("in_progress") and not allow_in_hand and membership == "player":
             continue
         removed = True
-        if membership == "pending":
-            table["pending_players"] = [name for name in table.get("pending_players", []) if name != player_name]
-            table["last_updated_epoch"] = time.time()
-            continue
-
-        try:
-            stack_cents = int(table.get("player_states", {}).get(player_name, {}).get("stack_cents", 0))
-        except (TypeError, ValueError):
-            stack_cents = 0
-        account = data.get("accounts", {}).get(player_name)
-        if stack_cents > 0 and isinstance(account, dict):
-            account["balance"] = house_round_balance(account.get("balance", 0.0) + from_cents(stack_cents))
-
-        table["players"] = [name for name in table.get("players", []) if name != player_name]
-        table["bot_players"] = [name for name in table.get("bot_players", []) if name != player_name]
-        table.get("player_states", {}).pop(player_name, None)
-        if table.get("host") == player_name:
-            humans = _poker_table_human_players(table)
-            table["host"] = humans[0] if humans else None
-
-        if table.get("in_progress") and isinstance(table.get("hand_state"), dict):
-            for hand_player in table["hand_state"].get("players", []):
-                if hand_player.get("name") == player_name:
-                    hand_player["folded"] = True
-                    hand_player["all_in"] = True
-            _poker_lan_append_history(table, f"{player_name} left during an active hand and was folded.")
-            _poker_run_bot_actions_unlocked(table)
-            hand_state = table.get("hand_state")
-            if isinstance(hand_state, dict) and hand_state.get("street") == "finished":
-                _poker_finalize_finished_hand_unlocked(data, table)
-
-        if not table.get("players", []):
-            reset = _default_poker_lan_table(table.get("id", 1), settings=lan_state.get("settings", {}))
-            reset["name"] = _normalize_poker_lan_table_name(table.get("name"), table.get("id", 1))
-            table.clear()
-            table.update(reset)
-        else:
-            if membership == "player" and (not bool(table.get("in_progress", False))):
-                _poker_refresh_bot_names_unlocked(table)
-            table["last_updated_epoch"] = time.time()
+        _poker_remove_player_from_table_unlocked(data, lan_state, table, player_name, membership, now_epoch)
     return removed
 
 
-def get_poker_lan_tables():
+def _poker_remove_player_from_table_unlocked(data, lan_state, table, player_name, membership, now_epoch):
+    # Callers that already found the player's table (join, leave) remove them
+    # here directly instead of sweeping every table a second time.
+    if membership == "pending":
+        _poker_discard_name(table.get("pending_players", []), player_name)
+        table["last_updated_epoch"] = now_epoch
+        return
+
+    player_states = table.setdefault("player_states", {})
+    try:
+        stack_cents = int(player_states[player_name]["stack_cents"])
+    except (KeyError, TypeError, ValueError):
+        stack_cents = 0
+    account = data.get("accounts", {}).get(player_name)
+    if stack_cents > 0 and isinstance(account, dict):
+        account["balance"] = house_round_balance(account.get("balance", 0.0) + from_cents(stack_cents))
+
+    _poker_discard_name(table.get("players", []), player_name)
+    _poker_table_players_changed(table)
+    _poker_discard_name(table.get("bot_players", []), player_name)
+    player_states.pop(player_name, None)
+    if table.get("host") == player_name:
+        humans = _poker_table_human_players(table)
+        table["host"] = humans[0] if humans else None
+
+    hand_state = table.get("hand_state")
+    if table.get("in_progress") and isinstance(hand_state, dict):
+        for hand_player in hand_state.get("players", []):
+            if hand_player.get("name") == player_name:
+                hand_player["folded"] = True
+                hand_player["all_in"] = True
+        _poker_lan_append_history(table, f"{player_name} left during an active hand and was folded.")
+        _poker_run_bot_actions_unlocked(table, hand_state)
+        if hand_state.get("street") == "finished":
+            _poker_finalize_finished_hand_unlocked(data, table, hand_state, player_states)
+
+    if not table.get("players", []):
+        reset = _default_poker_lan_table(table.get("id", 1), settings=lan_state.get("settings", {}))
+        # The table name is already normalized and stays in the name index.
+        reset["name"] = table.get("name") or reset["name"]
+        table.clear()
+        table.update(reset)
+    else:
+        if membership == "player" and (not bool(table.get("in_progress", False))):
+            _poker_refresh_bot_names_unlocked(table, now_epoch)
+        table["last_updated_epoch"] = now_epoch
+
+
+def _readable_poker_lan_state():
+    # Normalized poker LAN state for read helpers. The result may be shared
+    # with the published state, so callers must treat it as read-only.
+    lan_state = _poker_lan_snapshot()
+    if lan_state is not None:
+        return lan_state
+    published_lan_state = _load_data().get("poker_lan")
+    if isinstance(published_lan_state, dict) and published_lan_state.get("_normalized_version") == _POKER_LAN_NORMALIZE_VERSION:
+        # Normalized but missing its transient id index: index a shallow copy
+        # instead of copying, re-normalizing and comparing the whole subtree.
+        lan_state = dict(published_lan_state)
+        lan_state.pop("_tables_by_id", None)
+        _poker_lan_tables_by_id(lan_state)
+        return lan_state
     with _accounts_write_lock():
-        data = _load_data_for_write_unlocked()
-        before_data = deepcopy(data)
-        lan_state = _normalize_poker_lan_state(data.get("poker_lan", {}))
+        published = _load_data_unlocked(use_cache=_state_cache_is_authoritative(_get_storage_backend()))
+        data = dict(published) if published is not None else _default_data()
+        raw_lan_state = deepcopy(data.get("poker_lan", {}))
+        lan_state = _normalize_poker_lan_state(raw_lan_state)
         data["poker_lan"] = lan_state
-        _persist_if_changed_unlocked(data, before_data)
-        return deepcopy(lan_state.get("tables", []))
+        # Only the poker_lan subtree can change here, so only it is compared.
+        if _persistable_poker_lan_state(lan_state) != _persistable_poker_lan_state(raw_lan_state):
+            _write_data_unlocked(data)
+        return lan_state
+
+
+def _clone_poker_table(table):
+    # Caller-owned copy of a normalized table without its transient keys.
+    # Normalized tables only hold flat lists and dicts apart from the player
+    # states (one level deeper) and the hand state, so only the latter needs
+    # a generic deepcopy.
+    clone = {}
+    for key, value in table.items():
+        if key.startswith("_"):
+            continue
+        if key == "hand_state":
+            value = deepcopy(value)
+        elif key == "player_states":
+            value = {name: dict(state) for name, state in value.items()}
+        elif isinstance(value, list):
+            value = list(value)
+        elif isinstance(value, dict):
+            value = dict(value)
+        clone[key] = value
+    return clone
+
+
+def get_poker_lan_tables():
+    lan_state = _readable_poker_lan_state()
+    return [_clone_poker_table(table) for table in lan_state.get("tables", [])]
+
+
+def get_poker_lan_table(table_id):
+    # Single-table poll for spectators; read-only against the snapshot, so it
+    # never waits on table writers.
+    lan_state = _readable_poker_lan_state()
+    table = _poker_lan_table_by_id(lan_state, table_id)
+    if table is None:
+        return None
+    return _clone_poker_table(table)
 
 
 def get_poker_lan_settings():
-    with _accounts_write_lock():
-        data = _load_data_for_write_unlocked()
-        before_data = deepcopy(data)
-        lan_state = _normalize_poker_lan_state(data.get("poker_lan", {}))
-        data["poker_lan"] = lan_state
-        _persist_if_changed_unlocked(data, before_data)
-        return deepcopy(lan_state.get("settings", _default_poker_lan_settings()))
+    lan_state = _readable_poker_lan_state()
+    return dict(lan_state["settings"])
 
 
 def can_spectate_poker_lan_table(table_id, password=""):
-    with _accounts_write_lock():
-        data = _load_data_for_write_unlocked()
-        before_data = deepcopy(data)
-        lan_state = _normalize_poker_lan_state(data.get("poker_lan", {}))
-        table = _poker_lan_table_by_id(lan_state, table_id)
-        if table is None:
-            return False, "Table not found."
-        settings = _normalize_poker_lan_settings(lan_state.get("settings", {}))
-        if not bool(settings.get("allow_spectators_by_default", True)):
-            return False, "Spectating is disabled by admin settings."
-        if not bool(table.get("allow_spectators", True)):
-            return False, "Spectating is disabled for this table."
-        requires_password = bool(table.get("is_private", False)) or bool(table.get("spectators_require_password", False))
-        if requires_password and str(table.get("password", "")) != str(password or ""):
-            return False, "Incorrect table password."
-        data["poker_lan"] = lan_state
-        _persist_if_changed_unlocked(data, before_data)
-        return True, "Spectating allowed."
+    lan_state = _readable_poker_lan_state()
+    # Normalized states carry their id index, so this lookup is read-only.
+    table = _poker_lan_table_by_id(lan_state, table_id)
+    if table is None:
+        return False, "Table not found."
+    # Settings are already normalized by _normalize_poker_lan_state.
+    settings = lan_state["settings"]
+    if not bool(settings.get("allow_spectators_by_default", True)):
+        return False, "Spectating is disabled by admin settings."
+    if not bool(table.get("allow_spectators", True)):
+        return False, "Spectating is disabled for this table."
+    requires_password = bool(table.get("is_private", False)) or bool(table.get("spectators_require_password", False))
+    if requires_password and str(table.get("password", "")) != str(password or ""):
+        return False, "Incorrect table password."
+    return True, "Spectating allowed."
 
 
 def find_poker_lan_table_for_player(player_name):
     if not isinstance(player_name, str) or not player_name.strip():
         return None
-    normalized_player = player_name.strip()
-    with _accounts_write_lock():
-        data = _load_data_for_write_unlocked()
-        before_data = deepcopy(data)
-        lan_state = _normalize_poker_lan_state(data.get("poker_lan", {}))
-        for table in lan_state.get("tables", []):
-            membership = _poker_lan_table_member_state(table, normalized_player)
-            if membership is not None:
-                found = deepcopy(table)
-                found["membership"] = membership
-                data["poker_lan"] = lan_state
-                _persist_if_changed_unlocked(data, before_data)
-                return found
-        data["poker_lan"] = lan_state
-        _persist_if_changed_unlocked(data, before_data)
-        return None
+    normalized_player = sys.intern(player_name.strip())
+    lan_state = _readable_poker_lan_state()
+    for table in lan_state.get("tables", []):
+        membership = _poker_lan_snapshot_member_state(table, normalized_player)
+        if membership is not None:
+            found = _clone_poker_table(table)
+            found["membership"] = membership
+            return found
+    return None
 
 
 def create_poker_lan_table(
@@ -1479,14 +2328,11 @@ def create_poker_lan_table(
     with _accounts_write_lock():
         data = _load_data_for_write_unlocked()
         lan_state = _normalize_poker_lan_state(data.get("poker_lan", {}))
-        settings = _normalize_poker_lan_settings(lan_state.get("settings", {}))
+        settings = lan_state["settings"]
         table_id = _poker_lan_next_table_id(lan_state)
         table = _default_poker_lan_table(table_id, settings=settings)
         if max_players is not None:
-            try:
-                table["max_players"] = max(2, min(6, int(max_players)))
-            except (TypeError, ValueError):
-                pass
+            table["max_players"] = _clamp_int(max_players, 2, 6, table["max_players"])
         if min_buy_in is not None:
             table["min_buy_in"] = _coerce_poker_currency(min_buy_in, table["min_buy_in"])
         if max_buy_in is not None:
@@ -1511,34 +2357,34 @@ def create_poker_lan_table(
             table["name"] = _normalize_poker_lan_table_name(table_name, table_id)
         if turn_timeout_seconds is not None:
             table["turn_timeout_seconds"] = _coerce_poker_turn_timeout(turn_timeout_seconds, table["turn_timeout_seconds"])
-        try:
-            max_bots = min(POKER_LAN_MAX_BOTS_PER_TABLE, max(0, int(table["max_players"]) - 1))
-            normalized_bot_count = max(0, min(max_bots, int(bot_count)))
-        except (TypeError, ValueError):
-            normalized_bot_count = 0
-        table["bot_count"] = normalized_bot_count
+        table["bot_count"] = _clamp_int(bot_count, 0, _poker_lan_max_bots(table["max_players"]), 0)
         if bool(table.get("is_private")) and (not str(table.get("password", "")).strip()):
             return False, "Private tables must have a password."
         if bool(table.get("spectators_require_password")) and (not str(table.get("password", "")).strip()):
             return False, "Tables requiring spectator password must define a password."
 
         lane = lan_state.setdefault("tables", [])
-        for existing in lane:
-            if _normalize_poker_lan_table_name(existing.get("name"), existing.get("id")) == table["name"]:
-                return False, "A table with that name already exists."
+        name_index = _poker_lan_name_index(lan_state)
+        if table["name"] in name_index:
+            return False, "A table with that name already exists."
         used_names = set(table.get("players", []))
+        # Every bot sits down with the table minimum.
+        bot_stack_cents = max(0, to_cents(table.get("min_buy_in", 0.0)))
         for _bot_index in range(1, int(table.get("bot_count", 0)) + 1):
             bot_name = _poker_random_bot_name(used_names)
             used_names.add(bot_name)
             table.setdefault("players", []).append(bot_name)
             table.setdefault("bot_players", []).append(bot_name)
-            table.setdefault("player_states", {})[bot_name] = _normalize_poker_player_state(
-                {"stack_cents": int(round(float(table.get("min_buy_in", 0.0)) * 100)), "ready": True}
-            )
+            bot_state = _default_poker_player_state()
+            bot_state["stack_cents"] = bot_stack_cents
+            bot_state["ready"] = True
+            table.setdefault("player_states", {})[bot_name] = bot_state
             _poker_lan_append_history(table, f"{bot_name} joined the table.")
         table["phase"] = POKER_LAN_PHASE_WAITING
+        # Tables are kept sorted by id and new ids are always max + 1, so appending keeps the order.
         lane.append(table)
-        lan_state["tables"] = sorted(lane, key=lambda item: int(item.get("id", 0)))
+        name_index[table["name"]] = table_id
+        _poker_lan_tables_by_id(lan_state)[table_id] = table
         data["poker_lan"] = lan_state
         _write_data_unlocked(data)
         return True, f"Created table: {table['name']}"
@@ -1553,10 +2399,18 @@ def delete_poker_lan_table(table_id):
             return False, "Table not found."
         if bool(table.get("in_progress")):
             return True, "Cannot delete a table during an active hand."
-        human_players = [name for name in table.get("players", []) if not _poker_is_bot_name(name, table)]
+        human_players = _poker_table_human_players(table)
         if human_players or table.get("pending_players"):
             return True, "Cannot delete table while players are seated or queued."
-        lan_state["tables"] = [entry for entry in lan_state.get("tables", []) if int(entry.get("id", -1)) != int(table_id)]
+        tables = lan_state.get("tables", [])
+        for index, entry in enumerate(tables):
+            if entry is table:
+                del tables[index]
+                break
+        _poker_lan_tables_by_id(lan_state).pop(int(table["id"]), None)
+        name_index = _poker_lan_name_index(lan_state)
+        if name_index.get(table["name"]) == int(table["id"]):
+            del name_index[table["name"]]
         data["poker_lan"] = lan_state
         _write_data_unlocked(data)
         return True, f"Deleted table {int(table_id)}."
@@ -1586,10 +2440,7 @@ def update_poker_lan_table_settings(
         if bool(table.get("in_progress")):
             return False, "Cannot edit table during active hand."
 
-        try:
-            table["max_players"] = max(2, min(6, int(max_players)))
-        except (TypeError, ValueError):
-            pass
+        table["max_players"] = _clamp_int(max_players, 2, 6, table["max_players"])
         table["min_buy_in"] = _coerce_poker_currency(min_buy_in, table["min_buy_in"])
         table["max_buy_in"] = _coerce_poker_currency(max_buy_in, table["max_buy_in"])
         table["small_blind"] = max(0.01, _coerce_poker_currency(small_blind, table["small_blind"]))
@@ -1606,6 +2457,7 @@ def update_poker_lan_table_settings(
             table["is_private"] = bool(is_private)
         if password is not None:
             table["password"] = str(password)
+        previous_name = table["name"]
         if table_name is not None:
             table["name"] = _normalize_poker_lan_table_name(table_name, table_id)
         if turn_timeout_seconds is not None:
@@ -1619,6 +2471,15 @@ def update_poker_lan_table_settings(
         if len(table.get("players", [])) > int(table.get("max_players", 6)):
             return False, "Reduce player count before lowering max players."
 
+        if table["name"] != previous_name:
+            name_index = _poker_lan_name_index(lan_state)
+            existing_id = name_index.get(table["name"])
+            if existing_id is not None and existing_id != int(table["id"]):
+                return False, "A table with that name already exists."
+            if name_index.get(previous_name) == int(table["id"]):
+                del name_index[previous_name]
+            name_index[table["name"]] = int(table["id"])
+
         table["last_updated_epoch"] = time.time()
         data["poker_lan"] = lan_state
         _write_data_unlocked(data)
@@ -1629,7 +2490,8 @@ def update_poker_lan_global_settings(turn_timeout_seconds, allow_spectators_by_d
     with _accounts_write_lock():
         data = _load_data_for_write_unlocked()
         lan_state = _normalize_poker_lan_state(data.get("poker_lan", {}))
-        settings = _normalize_poker_lan_settings(lan_state.get("settings", {}))
+        # Normalized settings hold only scalars, so a flat copy is a full clone.
+        settings = dict(lan_state["settings"])
         settings["turn_timeout_seconds"] = _coerce_poker_turn_timeout(turn_timeout_seconds, settings["turn_timeout_seconds"])
         if allow_spectators_by_default is not None:
             settings["allow_spectators_by_default"] = bool(allow_spectators_by_default)
@@ -1642,8 +2504,26 @@ def update_poker_lan_global_settings(turn_timeout_seconds, allow_spectators_by_d
 def join_poker_lan_table(table_id, player_name, password="", buy_in=None):
     if not isinstance(player_name, str) or not player_name.strip():
         return False, "Invalid player."
-    normalized_player = player_name.strip()
+    normalized_player = sys.intern(player_name.strip())
+    snapshot_data = _peek_published_state()
+    if snapshot_data is not None and normalized_player not in snapshot_data.get("accounts", {}):
+        return False, "You must be signed in to join."
+    checked, snapshot_table = _poker_lan_snapshot_table(table_id)
+    if checked:
+        # Rejections and no-op joins only read state, so they are answered
+        # from the snapshot; anything that may write re-checks under the lock.
+        if snapshot_table is None:
+            return False, "Table not found."
+        if bool(snapshot_table.get("is_private")):
+            if str(snapshot_table.get("password", "")) != str(password or ""):
+                return False, "Incorrect table password."
+        if _poker_lan_snapshot_member_state(snapshot_table, normalized_player) is not None:
+            return True, "Already in this table."
+        seated_and_pending = len(snapshot_table.get("players", [])) + len(snapshot_table.get("pending_players", []))
+        if seated_and_pending >= int(snapshot_table.get("max_players", 6)):
+            return False, "Table is full."
     with _accounts_write_lock():
+        now_epoch = time.time()
         data = _load_data_for_write_unlocked()
         if normalized_player not in data.get("accounts", {}):
             return False, "You must be signed in to join."
@@ -1657,6 +2537,7 @@ def join_poker_lan_table(table_id, player_name, password="", buy_in=None):
             if str(destination.get("password", "")) != str(password or ""):
                 return False, "Incorrect table password."
 
+        left_previous_table = False
         for table in lan_state.get("tables", []):
             membership = _poker_lan_table_member_state(table, normalized_player)
             if membership is None:
@@ -1665,25 +2546,33 @@ def join_poker_lan_table(table_id, player_name, password="", buy_in=None):
                 return True, "Already in this table."
             if bool(table.get("in_progress")):
                 return False, "Leave your current active table before joining another."
-            _poker_remove_player_from_all_tables_unlocked(data, lan_state, normalized_player, allow_in_hand=False)
+            _poker_remove_player_from_table_unlocked(
+                data, lan_state, table, normalized_player, membership, now_epoch
+            )
+            left_previous_table = True
             break
 
-        if normalized_player in destination.get("players", []):
-            data["poker_lan"] = lan_state
-            _write_data_unlocked(data)
+        if normalized_player in _poker_table_player_set(destination):
+            # Only a move away from another table leaves anything to persist.
+            if left_previous_table:
+                data["poker_lan"] = lan_state
+                _write_data_unlocked(data)
             return True, "Already in this table."
 
         seated_and_pending = len(destination.get("players", [])) + len(destination.get("pending_players", []))
         if seated_and_pending >= int(destination.get("max_players", 6)):
             return False, "Table is full."
 
+        raw_min_buy_in = destination.get("min_buy_in", 0.01)
+        min_buy_in = float(raw_min_buy_in)
+        max_buy_in = float(destination.get("max_buy_in", raw_min_buy_in))
         if buy_in is None:
             buy_in = destination.get("min_buy_in", POKER_LAN_DEFAULT_MIN_BUY_IN)
-        normalized_buy_in = _coerce_poker_currency(buy_in, destination.get("min_buy_in", 0.01))
-        if normalized_buy_in < float(destination.get("min_buy_in", 0.01)):
-            return False, f"Minimum buy-in is ${float(destination.get('min_buy_in', 0.01)):.2f}."
-        if normalized_buy_in > float(destination.get("max_buy_in", destination.get("min_buy_in", 0.01))):
-            return False, f"Maximum buy-in is ${float(destination.get('max_buy_in', 0.01)):.2f}."
+        normalized_buy_in = _coerce_poker_currency(buy_in, raw_min_buy_in)
+        if normalized_buy_in < min_buy_in:
+            return False, f"Minimum buy-in is ${min_buy_in:.2f}."
+        if normalized_buy_in > max_buy_in:
+            return False, f"Maximum buy-in is ${max_buy_in:.2f}."
 
         account = data["accounts"].get(normalized_player, {})
         balance = house_round_balance(account.get("balance", 0.0))
@@ -1693,24 +2582,22 @@ def join_poker_lan_table(table_id, player_name, password="", buy_in=None):
 
         account["balance"] = house_round_balance(balance - normalized_buy_in)
 
+        destination.setdefault("player_states", {})[normalized_player] = _normalize_poker_player_state(
+            {"stack_cents": to_cents(normalized_buy_in)}
+        )
         if bool(destination.get("in_progress")):
             destination.setdefault("pending_players", []).append(normalized_player)
-            destination.setdefault("player_states", {})[normalized_player] = _normalize_poker_player_state(
-                {"stack_cents": int(round(normalized_buy_in * 100))}
-            )
             _poker_lan_append_history(destination, f"{normalized_player} queued for next hand.")
             data["poker_lan"] = lan_state
             _write_data_unlocked(data)
             return True, "Hand in progress. You are queued for next hand."
 
         destination.setdefault("players", []).append(normalized_player)
-        destination.setdefault("player_states", {})[normalized_player] = _normalize_poker_player_state(
-            {"stack_cents": int(round(normalized_buy_in * 100))}
-        )
+        _poker_table_players_changed(destination)
         if (not destination.get("host")) or _poker_is_bot_name(destination.get("host"), destination):
             destination["host"] = normalized_player
         destination["phase"] = POKER_LAN_PHASE_WAITING
-        destination["last_updated_epoch"] = time.time()
+        destination["last_updated_epoch"] = now_epoch
         _poker_lan_append_history(destination, f"{normalized_player} joined with ${normalized_buy_in:.2f}.")
 
         data["poker_lan"] = lan_state
@@ -1721,7 +2608,17 @@ def join_poker_lan_table(table_id, player_name, password="", buy_in=None):
 def leave_poker_lan_table(table_id, player_name):
     if not isinstance(player_name, str) or not player_name.strip():
         return False, "Invalid player."
-    normalized_player = player_name.strip()
+    normalized_player = sys.intern(player_name.strip())
+    checked, snapshot_table = _poker_lan_snapshot_table(table_id)
+    if checked:
+        # Leaving a table you are not at must not queue behind table writers.
+        if snapshot_table is None:
+            return False, "Table not found."
+        snapshot_membership = _poker_lan_snapshot_member_state(snapshot_table, normalized_player)
+        if snapshot_membership is None:
+            return True, "You are not in this table."
+        if snapshot_membership == "player" and bool(snapshot_table.get("in_progress")):
+            return False, "Cannot leave while a hand is in progress."
     with _accounts_write_lock():
         data = _load_data_for_write_unlocked()
         lan_state = _normalize_poker_lan_state(data.get("poker_lan", {}))
@@ -1735,78 +2632,111 @@ def leave_poker_lan_table(table_id, player_name):
         if membership == "player" and bool(table.get("in_progress")):
             return False, "Cannot leave while a hand is in progress."
 
-        _poker_remove_player_from_all_tables_unlocked(data, lan_state, normalized_player, allow_in_hand=False)
+        _poker_remove_player_from_table_unlocked(data, lan_state, table, normalized_player, membership, time.time())
         data["poker_lan"] = lan_state
         _write_data_unlocked(data)
         return True, f"Left table {int(table_id)}."
 
 
-def auto_remove_poker_lan_player(player_name):
+def auto_remove_poker_lan_player(player_name, sync=True):
     if not isinstance(player_name, str) or not player_name.strip():
         return False, "Invalid player."
-    normalized_player = player_name.strip()
+    normalized_player = sys.intern(player_name.strip())
+    snapshot = _poker_lan_snapshot()
+    if snapshot is not None and not any(
+        _poker_lan_snapshot_member_state(table, normalized_player) is not None for table in snapshot.get("tables", [])
+    ):
+        # Sign-out and navigation call this for players who never sat down;
+        # they are turned away without the write lock or a state copy.
+        return True, "Player was not in poker multiplayer tables."
     with _accounts_write_lock():
         data = _load_data_for_write_unlocked()
         lan_state = _normalize_poker_lan_state(data.get("poker_lan", {}))
         removed = _poker_remove_player_from_all_tables_unlocked(data, lan_state, normalized_player, allow_in_hand=True)
+        if not removed:
+            return True, "Player was not in poker multiplayer tables."
         data["poker_lan"] = lan_state
-        _write_data_unlocked(data)
-        if removed:
-            return True, "Player removed from poker multiplayer tables."
-        return True, "Player was not in poker multiplayer tables."
+        if sync:
+            _write_data_unlocked(data)
+        else:
+            # Batched sweeps (logout) upload once and must call
+            # flush_pending_writes() before reporting success.
+            _schedule_write_unlocked(data)
+        return True, "Player removed from poker multiplayer tables."
 
 
 def set_poker_lan_player_ready(table_id, player_name, ready=True):
     if not isinstance(player_name, str) or not player_name.strip():
         return False, "Invalid player.", False
-    normalized_player = player_name.strip()
+    normalized_player = sys.intern(player_name.strip())
+    checked, snapshot_table = _poker_lan_snapshot_table(table_id)
+    if checked:
+        # Reject stale clicks without queueing behind other table writers.
+        if snapshot_table is None:
+            return False, "Table not found.", False
+        if normalized_player not in snapshot_table.get("players", []):
+            return False, "Join this table first.", False
+        if bool(snapshot_table.get("in_progress")):
+            return False, "Hand already in progress.", False
     with _accounts_write_lock():
-        data = _load_data_for_write_unlocked()
-        lan_state = _normalize_poker_lan_state(data.get("poker_lan", {}))
-        table = _poker_lan_table_by_id(lan_state, table_id)
+        data, lan_state, table = _load_poker_table_for_write_unlocked(table_id)
         if table is None:
             return False, "Table not found.", False
-        if normalized_player not in table.get("players", []):
+        if normalized_player not in _poker_table_player_set(table):
             return False, "Join this table first.", False
         if bool(table.get("in_progress")):
             return False, "Hand already in progress.", False
 
-        table.setdefault("player_states", {}).setdefault(normalized_player, _normalize_poker_player_state({}))
-        table["player_states"][normalized_player]["ready"] = bool(ready)
-        table["last_updated_epoch"] = time.time()
+        player_states = table.setdefault("player_states", {})
+        player_state = player_states.get(normalized_player)
+        if player_state is None:
+            player_state = _default_poker_player_state()
+            player_states[normalized_player] = player_state
+        ready_changed = player_state["ready"] != bool(ready)
+        player_state["ready"] = bool(ready)
+        now_epoch = time.time()
+        table["last_updated_epoch"] = now_epoch
 
         if not bool(ready):
+            if not ready_changed and table.get("phase") == POKER_LAN_PHASE_WAITING:
+                return True, "You are no longer ready.", False
             table["phase"] = POKER_LAN_PHASE_WAITING
             data["poker_lan"] = lan_state
-            _write_data_unlocked(data)
+            _schedule_write_unlocked(data)
             return True, "You are no longer ready.", False
 
-        seated_ready = [
-            name
-            for name in table.get("players", [])
-            if (
-                bool(table.get("player_states", {}).get(name, {}).get("ready", False))
-                or _poker_is_bot_name(name, table)
-            )
-            and int(table.get("player_states", {}).get(name, {}).get("stack_cents", 0)) > 0
-        ]
-        seated_eligible = [
-            name
-            for name in table.get("players", [])
-            if int(table.get("player_states", {}).get(name, {}).get("stack_cents", 0)) > 0
-        ]
-
-        if len(seated_eligible) >= 2 and len(seated_ready) == len(seated_eligible):
-            start_index = int(table.get("dealer_index", 0))
-            start_stacks = [
-                (name, from_cents(int(table["player_states"][name]["stack_cents"]))) for name in seated_eligible
-            ]
+        # Bot seats are classified once and reused for the ready check and the
+        # post-start ready reset.
+        seats = table.get("players") or ()
+        bot_seats = _poker_table_bot_set(table)
+        # One pass checks that every funded seat is ready and collects the
+        # stacks the hand starts with; the first unready seat ends it. A lone
+        # seat can never start a hand, so it skips the scan altogether.
+        seated_eligible = []
+        all_ready = len(seats) >= 2
+        if all_ready:
+            for name in seats:
+                # Normalized seat states are canonical (int cents, bool ready),
+                # so the fields are used without re-coercing them.
+                seat_state = player_states.get(name, _POKER_PLAYER_STATE_PROTOTYPE)
+                stack_cents = seat_state["stack_cents"]
+                if stack_cents <= 0:
+                    continue
+                if not (seat_state["ready"] or name in bot_seats):
+                    all_ready = False
+                    break
+                seated_eligible.append((name, stack_cents))
+
+        eligible_count = len(seated_eligible)
+        if all_ready and eligible_count >= 2:
+            dealer_index = int(table.get("dealer_index", 0))
+            start_stacks = [(name, from_cents(stack_cents)) for name, stack_cents in seated_eligible]
             hand_state, error = poker_create_hand(
                 start_stacks,
                 table.get("small_blind", POKER_LAN_DEFAULT_SMALL_BLIND),
                 table.get("big_blind", POKER_LAN_DEFAULT_BIG_BLIND),
                 min_raise=table.get("min_raise", POKER_LAN_DEFAULT_MIN_RAISE),
-                dealer_index=max(0, min(start_index, len(start_stacks) - 1)),
+                dealer_index=max(0, min(dealer_index, eligible_count - 1)),
             )
             if hand_state is None:
                 return False, error or "Failed to start hand.", False
@@ -1815,36 +2745,55 @@ def set_poker_lan_player_ready(table_id, player_name, ready=True):
             table["phase"] = POKER_LAN_PHASE_IN_HAND
             table["in_progress"] = True
             table["hand_state"] = hand_state
-            table["turn_started_epoch"] = time.time()
+            table["turn_started_epoch"] = now_epoch
+            # Freshly created hands carry integer cents for every seat.
             table["hand_start_stacks"] = {
-                player["name"]: int(player.get("stack", 0)) + int(player.get("committed_total", 0))
-                for player in hand_state.get("players", [])
+                player["name"]: player["stack"] + player["committed_total"] for player in hand_state["players"]
             }
-            table["dealer_index"] = (int(table.get("dealer_index", 0)) + 1) % max(1, len(seated_eligible))
-            for name in table.get("players", []):
-                table.setdefault("player_states", {}).setdefault(name, _normalize_poker_player_state({}))
-                table["player_states"][name]["ready"] = _poker_is_bot_name(name, table)
-            _poker_run_bot_actions_unlocked(table)
+            table["dealer_index"] = (dealer_index + 1) % eligible_count
+            for name in seats:
+                seat_state = player_states.get(name)
+                if seat_state is None:
+                    seat_state = _default_poker_player_state()
+                    player_states[name] = seat_state
+                seat_state["ready"] = name in bot_seats
+            _poker_run_bot_actions_unlocked(table, hand_state)
             if hand_state.get("street") == "finished":
-                _poker_finalize_finished_hand_unlocked(data, table)
+                _poker_finalize_finished_hand_unlocked(data, table, hand_state, player_states)
             _poker_lan_append_history(table, f"Round {table['round']} started.")
             data["poker_lan"] = lan_state
-            _write_data_unlocked(data)
+            _schedule_write_unlocked(data)
             return True, f"Round {table['round']} started.", True
 
+        if not ready_changed:
+            # Repeated ready toggles carry no delta worth uploading.
+            return True, "You are ready.", False
         data["poker_lan"] = lan_state
-        _write_data_unlocked(data)
+        _schedule_write_unlocked(data)
         return True, "You are ready.", False
 
 
 def poker_lan_player_action(table_id, player_name, action, amount=None):
     if not isinstance(player_name, str) or not player_name.strip():
         return False, "Invalid player."
-    normalized_player = player_name.strip()
+    normalized_player = sys.intern(player_name.strip())
+    checked, snapshot_table = _poker_lan_snapshot_table(table_id)
+    if checked:
+        # Out-of-turn and stale submissions are rejected without the write lock.
+        if snapshot_table is None:
+            return False, "Table not found."
+        if not bool(snapshot_table.get("in_progress")):
+            return False, "No active hand."
+        snapshot_hand = snapshot_table.get("hand_state")
+        if not isinstance(snapshot_hand, dict):
+            return False, "Hand state unavailable."
+        if not poker_legal_actions(snapshot_hand, normalized_player).get("actions"):
+            return False, "You cannot act right now."
+        if str(action).strip().lower() not in _POKER_ENGINE_ACTIONS:
+            # The engine rejects these without touching the hand.
+            return False, "Invalid action."
     with _accounts_write_lock():
-        data = _load_data_for_write_unlocked()
-        lan_state = _normalize_poker_lan_state(data.get("poker_lan", {}))
-        table = _poker_lan_table_by_id(lan_state, table_id)
+        data, lan_state, table = _load_poker_table_for_write_unlocked(table_id)
         if table is None:
             return False, "Table not found."
         if not bool(table.get("in_progress")):
@@ -1865,11 +2814,10 @@ def poker_lan_player_action(table_id, player_name, action, amount=None):
         table["turn_started_epoch"] = time.time()
         _poker_lan_append_history(table, f"{normalized_player}: {str(action).lower()}")
 
-        _poker_run_bot_actions_unlocked(table)
-        hand_state = table.get("hand_state")
+        _poker_run_bot_actions_unlocked(table, hand_state)
         if hand_state.get("street") == "finished":
-            _poker_finalize_finished_hand_unlocked(data, table)
+            _poker_finalize_finished_hand_unlocked(data, table, hand_state)
 
         data["poker_lan"] = lan_state
-        _write_data_unlocked(data)
+        _schedule_write_unlocked(data)
         return True, "Action submitted."
@@ -55,6 +55,7 @@ try:
         delete_poker_lan_table,
         find_poker_lan_table_for_player,
         get_poker_lan_settings,
+        get_poker_lan_table,
         get_poker_lan_tables,
         join_poker_lan_table,
         leave_poker_lan_table,
@@ -93,6 +94,9 @@ except ImportError:
             "turn_timeout_seconds": 30,
         }
 
+    def get_poker_lan_table(_table_id):
+        return None
+
     def get_poker_lan_tables():
         return []
 
@@ -578,6 +582,11 @@ def _cached_poker_lan_tables():
     return get_poker_lan_tables()
 
 
+@st.cache_data(ttl=0.9, show_spinner=False)
+def _cached_poker_lan_table(table_id):
+    return get_poker_lan_table(table_id)
+
+
 @st.cache_data(ttl=0.9, show_spinner=False)
 def _cached_find_poker_lan_table_for_player(player_name):
     return find_poker_lan_table_for_player(player_name)
@@ -587,6 +596,7 @@ def _invalidate_poker_lan_ui_caches():
     for cached_func in (
         _cached_poker_lan_settings,
         _cached_poker_lan_tables,
+        _cached_poker_lan_table,
         _cached_find_poker_lan_table_for_player,
     ):
         try:
@@ -2913,21 +2923,32 @@ def blackjack_draw_card(round_state):
     return round_state["deck"].pop()
 
 
-def blackjack_hand_total(cards):
-    total = 0
-    aces = 0
-    for rank, _suit in cards:
-        if rank == "A":
-            total += 11
-            aces += 1
-        elif rank in {"J", "Q", "K"}:
-            total += 10
-        else:
-            total += int(rank)
-    while total > 21 and aces > 0:
+def _blackjack_add_card_to_score(score, card):
+    # score is (total, aces still counted as 11), so a hit costs O(1).
+    total, soft_aces = score
+    rank = card[0]
+    if rank == "A":
+        total += 11
+        soft_aces += 1
+    elif rank in {"J", "Q", "K"}:
+        total += 10
+    else:
+        total += int(rank)
+    while total > 21 and soft_aces > 0:
         total -= 10
-        aces -= 1
-    return total
+        soft_aces -= 1
+    return total, soft_aces
+
+
+def _blackjack_hand_score(cards):
+    score = (0, 0)
+    for card in cards:
+        score = _blackjack_add_card_to_score(score, card)
+    return score
+
+
+def blackjack_hand_total(cards):
+    return _blackjack_hand_score(cards)[0]
 
 
 def blackjack_is_natural(cards):
@@ -3514,9 +3535,13 @@ def start_blackjack_round(account, bet, is_guest_mode):
 def run_blackjack_dealer_turn(account, round_state, is_guest_mode):
     drawn_indexes = []
     drawn_cards = []
-    while blackjack_hand_total(round_state["dealer_cards"]) < int(round_state["dealer_stop_total"]):
-        round_state["dealer_cards"].append(blackjack_draw_card(round_state))
-        drawn_cards.append(round_state["dealer_cards"][-1])
+    dealer_stop_total = int(round_state["dealer_stop_total"])
+    dealer_score = _blackjack_hand_score(round_state["dealer_cards"])
+    while dealer_score[0] < dealer_stop_total:
+        card = blackjack_draw_card(round_state)
+        round_state["dealer_cards"].append(card)
+        dealer_score = _blackjack_add_card_to_score(dealer_score, card)
+        drawn_cards.append(card)
         drawn_indexes.append(len(round_state["dealer_cards"]) - 1)
     round_state["animate_dealer_indexes"] = drawn_indexes
     round_state["animate_player_indexes"] = []
@@ -3525,7 +3550,7 @@ def run_blackjack_dealer_turn(account, round_state, is_guest_mode):
         round_state.setdefault("history", []).append(f"Dealer drew: {labels}.")
 
     player_total = blackjack_hand_total(round_state["player_cards"])
-    dealer_total = blackjack_hand_total(round_state["dealer_cards"])
+    dealer_total = dealer_score[0]
 
     if dealer_total > 21:
         return settle_blackjack_round(
@@ -4593,10 +4618,7 @@ def render_poker_multiplayer(account):
             st.session_state["poker_lan_spectate_password"] = ""
             _fast_rerun(force=True)
             return
-        table_to_view = next(
-            (entry for entry in _cached_poker_lan_tables() if int(entry.get("id", -1)) == int(spectate_table_id)),
-            None,
-        )
+        table_to_view = _cached_poker_lan_table(int(spectate_table_id))
         is_spectator = True
     if table_to_view is None:
         st.warning("Table not found.")
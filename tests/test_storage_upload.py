@@ -0,0 +1,61 @@
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SUPABASE_URL", "http://supabase.test")
+os.environ.setdefault("SUPABASE_SERVICE_ROLE_KEY", "test-key")
+
+import storage  # noqa: E402
+
+
+class FakeSupabase:
+    # Stands in for the state row; another process is simulated by replacing
+    # the row directly.
+    def __init__(self):
+        self.row = None
+        self.writes = 0
+
+    def request(self, method, path, payload=None, extra_headers=None):
+        if method == "GET":
+            if self.row is None:
+                return b"[]"
+            return json.dumps([{"data": self.row}]).encode("utf-8")
+        self.writes += 1
+        self.row = json.loads(payload)[0]["data"]
+        return b""
+
+
+class UploadSkipTest(unittest.TestCase):
+    def setUp(self):
+        self.fake = FakeSupabase()
+        self._original_request = storage._supabase_request_raw
+        storage._supabase_request_raw = self.fake.request
+        storage._invalidate_state_read_cache()
+        storage._last_read_state = None
+        storage._last_uploaded_body = None
+        storage._last_uploaded_state = None
+
+    def tearDown(self):
+        storage._supabase_request_raw = self._original_request
+        storage._invalidate_state_read_cache()
+
+    def test_rewrite_after_foreign_revert_is_uploaded(self):
+        self.assertTrue(storage.create_account_record("alice", 0))
+        reverted_row = json.loads(json.dumps(self.fake.row))
+        storage._invalidate_state_read_cache()
+        self.assertEqual(storage.get_account_value("alice"), 0.0)
+
+        # Process A stores a balance, process B writes the old row back, and
+        # A stores the same balance again once its cache has lapsed.
+        self.assertTrue(storage.set_account_value("alice", 5))
+        self.fake.row = json.loads(json.dumps(reverted_row))
+        storage._invalidate_state_read_cache()
+        self.assertTrue(storage.set_account_value("alice", 5))
+
+        self.assertEqual(self.fake.row["accounts"]["alice"]["balance"], 5.0)
+
+
+if __name__ == "__main__":
+    unittest.main()